@@ -69,7 +69,7 @@ __version__ = '3.11.1'
 
 # do not change this line manually
 # this is managed by proto/build-proto.sh and updated on every execution
-__proto_version__ = '0.1.13'
+__proto_version__ = '0.1.14'
 
 try:
     __docarray_version__ = _docarray.__version__
@@ -92,8 +92,6 @@ __jina_env__ = (
     'JINA_EARLY_STOP',
     'JINA_FULL_CLI',
     'JINA_GATEWAY_IMAGE',
-    'JINA_GRPC_RECV_BYTES',
-    'JINA_GRPC_SEND_BYTES',
     'JINA_HUB_NO_IMAGE_REBUILD',
     'JINA_LOG_CONFIG',
     'JINA_LOG_LEVEL',
@@ -11,7 +11,11 @@ from typing import (
     TYPE_CHECKING,
 )
 
-from jina.clients.request.helper import _new_data_request_from_batch, _new_data_request
+from jina.clients.request.helper import (
+    _get_deadline,
+    _new_data_request,
+    _new_data_request_from_batch,
+)
 from jina.enums import DataInputType
 from jina.helper import batch_iterator
 from jina.logging.predefined import default_logger
@@ -42,6 +46,7 @@ def request_generator(
     data_type: DataInputType = DataInputType.AUTO,
     target_executor: Optional[str] = None,
     parameters: Optional[Dict] = None,
+    timeout: Optional[float] = None,
     **kwargs,  # do not remove this, add on purpose to suppress unknown kwargs
 ) -> Iterator['Request']:
     """Generate a request iterator.
@@ -53,17 +58,23 @@ def request_generator(
             or an iterator over possible Document content (set to text, blob and buffer).
     :param parameters: a dictionary of parameters to be sent to the executor
     :param target_executor: a regex string. Only matching Executors will process the request.
+    :param timeout: if set, the requests are dropped by the Flow when they are not processed within this many seconds
+        from the start of the generation
     :param kwargs: additional arguments
     :yield: request
     """
 
     _kwargs = dict(extra_kwargs=kwargs)
+    deadline = _get_deadline(timeout)
 
     try:
         if data is None:
             # this allows empty inputs, i.e. a data request with only parameters
             yield _new_data_request(
-                endpoint=exec_endpoint, target=target_executor, parameters=parameters
+                endpoint=exec_endpoint,
+                target=target_executor,
+                parameters=parameters,
+                deadline=deadline,
             )
         else:
             if not isinstance(data, Iterable):
@@ -76,6 +87,7 @@ def request_generator(
                     endpoint=exec_endpoint,
                     target=target_executor,
                     parameters=parameters,
+                    deadline=deadline,
                 )
 
     except Exception as ex:
@@ -2,7 +2,11 @@
 
 from typing import AsyncIterator, Optional, Dict, TYPE_CHECKING
 
-from jina.clients.request.helper import _new_data_request_from_batch, _new_data_request
+from jina.clients.request.helper import (
+    _get_deadline,
+    _new_data_request,
+    _new_data_request_from_batch,
+)
 from jina.enums import DataInputType
 from jina.importer import ImportExtensions
 from jina.logging.predefined import default_logger
@@ -19,6 +23,7 @@ async def request_generator(
     data_type: DataInputType = DataInputType.AUTO,
     target_executor: Optional[str] = None,
     parameters: Optional[Dict] = None,
+    timeout: Optional[float] = None,
     **kwargs,  # do not remove this, add on purpose to suppress unknown kwargs
 ) -> AsyncIterator['Request']:
     """An async :function:`request_generator`.
@@ -30,17 +35,23 @@ async def request_generator(
             or an iterator over possible Document content (set to text, blob and buffer).
     :param parameters: the kwargs that will be sent to the executor
     :param target_executor: a regex string. Only matching Executors will process the request.
+    :param timeout: if set, the requests are dropped by the Flow when they are not processed within this many seconds
+        from the start of the generation
     :param kwargs: additional arguments
     :yield: request
     """
 
     _kwargs = dict(extra_kwargs=kwargs)
+    deadline = _get_deadline(timeout)
 
     try:
         if data is None:
             # this allows empty inputs, i.e. a data request with only parameters
             yield _new_data_request(
-                endpoint=exec_endpoint, target=target_executor, parameters=parameters
+                endpoint=exec_endpoint,
+                target=target_executor,
+                parameters=parameters,
+                deadline=deadline,
             )
         else:
             with ImportExtensions(required=True):
@@ -54,6 +65,7 @@ async def request_generator(
                     endpoint=exec_endpoint,
                     target=target_executor,
                     parameters=parameters,
+                    deadline=deadline,
                 )
     except Exception as ex:
         # must be handled here, as grpc channel wont handle Python exception
@@ -1,5 +1,7 @@
 """Module for helper functions for clients."""
-from typing import Tuple
+import math
+import time
+from typing import Optional, Tuple
 
 from docarray import Document, DocumentArray
 from jina.enums import DataInputType
@@ -7,9 +9,9 @@ from jina.types.request.data import DataRequest
 
 
 def _new_data_request_from_batch(
-    _kwargs, batch, data_type, endpoint, target, parameters
+    _kwargs, batch, data_type, endpoint, target, parameters, deadline=None
 ):
-    req = _new_data_request(endpoint, target, parameters)
+    req = _new_data_request(endpoint, target, parameters, deadline)
 
     # add docs fields
     _add_docs(req, batch, data_type, _kwargs)
@@ -17,7 +19,7 @@ def _new_data_request_from_batch(
     return req
 
 
-def _new_data_request(endpoint, target, parameters):
+def _new_data_request(endpoint, target, parameters, deadline=None):
     req = DataRequest()
 
     # set up header
@@ -25,12 +27,21 @@ def _new_data_request(endpoint, target, parameters):
         req.header.exec_endpoint = endpoint
     if target:
         req.header.target_executor = target
+    if deadline:
+        req.header.timeout = deadline
     # add parameters field
     if parameters:
         req.parameters = parameters
     return req
 
 
+def _get_deadline(timeout: Optional[float]) -> Optional[int]:
+    # the header stores the deadline as epoch seconds, round up so that requests are never dropped too early
+    if timeout is None:
+        return None
+    return math.ceil(time.time() + timeout)
+
+
 def _new_doc_from_data(
     data, data_type: DataInputType, **kwargs
 ) -> Tuple['Document', 'DataInputType']:
@@ -144,6 +144,14 @@ class PollingType(BetterEnum):
         return self.value == 2
 
 
+class LoadBalancingType(BetterEnum):
+    """The strategy used to select one replica of a Deployment when sending it a request."""
+
+    ROUND_ROBIN = 0  #: cycle through the replicas one after another
+    LEAST_OUTSTANDING = 1  #: pick the replica with the fewest in-flight requests
+    LATENCY_AWARE = 2  #: pick the faster of two random replicas, based on their moving average latency
+
+
 class LogVerbosity(BetterEnum):
     """Verbosity level of the logger."""
 
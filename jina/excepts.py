@@ -136,3 +136,23 @@ class InternalNetworkError(grpc.aio.AioRpcError, BaseJinaException):
         :return: details of this exception
         """
         return self._details if self._details else self.og_exception.details()
+
+
+class RequestDeadlineExceeded(InternalNetworkError):
+    """Raised when a request is dropped because the deadline set in its header has passed"""
+
+    def __init__(self, request_id: str = '', details: str = ''):
+        """
+        :param request_id: id of the dropped request
+        :param details: details of the error
+        """
+        super().__init__(
+            og_exception=grpc.aio.AioRpcError(
+                grpc.StatusCode.DEADLINE_EXCEEDED,
+                grpc.aio.Metadata(),
+                grpc.aio.Metadata(),
+                details,
+            ),
+            request_id=request_id,
+            details=details,
+        )
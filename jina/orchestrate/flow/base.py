@@ -44,6 +44,7 @@ from jina.enums import (
     FlowBuildLevel,
     FlowInspectType,
     GatewayProtocolType,
+    LoadBalancingType,
 )
 from jina.excepts import (
     FlowMissingDeploymentError,
@@ -156,9 +157,13 @@ class Flow(
     def __init__(
         self,
         *,
+        circuit_breaker_error_rate: Optional[float] = None,
+        circuit_breaker_failures: Optional[int] = None,
+        circuit_breaker_probe_interval: Optional[float] = 1.0,
         compression: Optional[str] = None,
         cors: Optional[bool] = False,
         deployments_addresses: Optional[str] = '{}',
+        deployments_load_balancing: Optional[str] = '{}',
         deployments_metadata: Optional[str] = '{}',
         deployments_no_reduce: Optional[str] = '[]',
         description: Optional[str] = None,
@@ -171,24 +176,29 @@ class Flow(
         graph_conditions: Optional[str] = '{}',
         graph_description: Optional[str] = '{}',
         grpc_server_options: Optional[dict] = None,
+        hedging_budget: Optional[float] = 0.1,
+        hedging_percentile: Optional[float] = None,
         host: Optional[str] = '0.0.0.0',
         log_config: Optional[str] = None,
         metrics: Optional[bool] = False,
         metrics_exporter_host: Optional[str] = None,
         metrics_exporter_port: Optional[int] = None,
         monitoring: Optional[bool] = False,
+        multiplex_requests: Optional[bool] = False,
         name: Optional[str] = 'gateway',
         no_crud_endpoints: Optional[bool] = False,
         no_debug_endpoints: Optional[bool] = False,
         port: Optional[str] = None,
         port_monitoring: Optional[str] = None,
         prefetch: Optional[int] = 1000,
+        prewarm_connections: Optional[bool] = False,
         protocol: Optional[str] = 'GRPC',
         proxy: Optional[bool] = False,
         py_modules: Optional[List[str]] = None,
         quiet: Optional[bool] = False,
         quiet_error: Optional[bool] = False,
         retries: Optional[int] = -1,
+        retry_budget: Optional[float] = None,
         runtime_cls: Optional[str] = 'GatewayRuntime',
         ssl_certfile: Optional[str] = None,
         ssl_keyfile: Optional[str] = None,
@@ -207,9 +217,13 @@ class Flow(
     ):
         """Create a Flow. Flow is how Jina streamlines and scales Executors. This overloaded method provides arguments from `jina gateway` CLI.
 
+        :param circuit_breaker_error_rate: If set, a replica is ejected from the load balancing when the fraction of failed gRPC calls among its recent calls reaches this value (e.g. 0.5). Ejected replicas are health checked and let back in once they are serving again. Disabled by default
+        :param circuit_breaker_failures: If set, a replica is ejected from the load balancing after this many consecutive failed gRPC calls. Ejected replicas are health checked and let back in once they are serving again. Disabled by default
+        :param circuit_breaker_probe_interval: The interval in seconds between two health checks of an ejected replica
         :param compression: The compression mechanism used when sending requests from the Head to the WorkerRuntimes. For more details, check https://grpc.github.io/grpc/python/grpc.html#compression.
         :param cors: If set, a CORS middleware is added to FastAPI frontend to allow cross-origin access.
         :param deployments_addresses: JSON dictionary with the input addresses of each Deployment
+        :param deployments_load_balancing: JSON dictionary with the load balancing strategy used to select the replicas of each Deployment
         :param deployments_metadata: JSON dictionary with the request metadata for each Deployment
         :param deployments_no_reduce: list JSON disabling the built-in merging mechanism for each Deployment listed
         :param description: The description of this HTTP server. It will be used in automatics docs such as Swagger UI.
@@ -225,12 +239,15 @@ class Flow(
         :param graph_conditions: Dictionary stating which filtering conditions each Executor in the graph requires to receive Documents.
         :param graph_description: Routing graph for the gateway
         :param grpc_server_options: Dictionary of kwargs arguments that will be passed to the grpc server as options when starting the server, example : {'grpc.max_send_message_length': -1}
+        :param hedging_budget: The maximum fraction of the requests that can be sent to a second replica when `--hedging-percentile` is set
+        :param hedging_percentile: If set, a request that did not get a response after this percentile (e.g. 95) of the recent response latencies of a Deployment is sent to a second replica. The first response is used and the other call is cancelled. Only use it for idempotent Executors. Disabled by default
         :param host: The host address of the runtime, by default it is 0.0.0.0. In the case of an external Executor (`--external` or `external=True`) this can be a list of hosts, separated by commas. Then, every resulting address will be considered as one replica of the Executor.
         :param log_config: The YAML config of the logger used in this object.
         :param metrics: If set, the sdk implementation of the OpenTelemetry metrics will be available for default monitoring and custom measurements. Otherwise a no-op implementation will be provided.
         :param metrics_exporter_host: If tracing is enabled, this hostname will be used to configure the metrics exporter agent.
         :param metrics_exporter_port: If tracing is enabled, this port will be used to configure the metrics exporter agent.
         :param monitoring: If set, spawn an http server with a prometheus endpoint to expose metrics
+        :param multiplex_requests: If set, the requests sent by this Pod to a Head or Executor go through one long-lived bidirectional gRPC stream per connection, instead of one gRPC call per request. Responses are matched to their requests by request_id. This reduces the per-call overhead for high QPS traffic of small requests, but with tracing enabled all the requests of a stream share the span of the stream
         :param name: The name of this object.
 
               This will be used in the following places:
@@ -249,6 +266,7 @@ class Flow(
         :param prefetch: Number of requests fetched from the client before feeding into the first Executor.
 
               Used to control the speed of data input into a Flow. 0 disables prefetch (1000 requests is the default)
+        :param prewarm_connections: If set, the connections of this Pod to a Head or Executor are established in the background as soon as they are added, and a replica only receives requests once its connection is ready. Otherwise, the connection is established by the first request sent to the replica
         :param protocol: Communication protocol between server and client.
         :param proxy: If set, respect the http_proxy and https_proxy environment variables. otherwise, it will unset these proxy variables before start. gRPC seems to prefer no proxy
         :param py_modules: The customized python modules need to be imported before loading the gateway
@@ -259,6 +277,7 @@ class Flow(
         :param quiet: If set, then no log will be emitted from this object.
         :param quiet_error: If set, then exception stack information will not be added to the log
         :param retries: Number of retries per gRPC call. If <0 it defaults to max(3, num_replicas)
+        :param retry_budget: If set, the maximum fraction of the requests (e.g. 0.1) that can be retried, shared by all the requests sent by this Pod. Retries beyond the budget are not sent and the request fails immediately, which prevents retry storms during partial outages. Disabled by default
         :param runtime_cls: The runtime class to run inside the Pod
         :param ssl_certfile: the path to the certificate file
         :param ssl_keyfile: the path to the key file
@@ -378,9 +397,13 @@ class Flow(
         :param traces_exporter_host: If tracing is enabled, this hostname will be used to configure the trace exporter agent.
         :param traces_exporter_port: If tracing is enabled, this port will be used to configure the trace exporter agent.
         :param tracing: If set, the sdk implementation of the OpenTelemetry tracer will be available and will be enabled for automatic tracing of requests and customer span creation. Otherwise a no-op implementation will be provided.
+        :param circuit_breaker_error_rate: If set, a replica is ejected from the load balancing when the fraction of failed gRPC calls among its recent calls reaches this value (e.g. 0.5). Ejected replicas are health checked and let back in once they are serving again. Disabled by default
+        :param circuit_breaker_failures: If set, a replica is ejected from the load balancing after this many consecutive failed gRPC calls. Ejected replicas are health checked and let back in once they are serving again. Disabled by default
+        :param circuit_breaker_probe_interval: The interval in seconds between two health checks of an ejected replica
         :param compression: The compression mechanism used when sending requests from the Head to the WorkerRuntimes. For more details, check https://grpc.github.io/grpc/python/grpc.html#compression.
         :param cors: If set, a CORS middleware is added to FastAPI frontend to allow cross-origin access.
         :param deployments_addresses: JSON dictionary with the input addresses of each Deployment
+        :param deployments_load_balancing: JSON dictionary with the load balancing strategy used to select the replicas of each Deployment
         :param deployments_metadata: JSON dictionary with the request metadata for each Deployment
         :param deployments_no_reduce: list JSON disabling the built-in merging mechanism for each Deployment listed
         :param description: The description of this HTTP server. It will be used in automatics docs such as Swagger UI.
@@ -396,12 +419,15 @@ class Flow(
         :param graph_conditions: Dictionary stating which filtering conditions each Executor in the graph requires to receive Documents.
         :param graph_description: Routing graph for the gateway
         :param grpc_server_options: Dictionary of kwargs arguments that will be passed to the grpc server as options when starting the server, example : {'grpc.max_send_message_length': -1}
+        :param hedging_budget: The maximum fraction of the requests that can be sent to a second replica when `--hedging-percentile` is set
+        :param hedging_percentile: If set, a request that did not get a response after this percentile (e.g. 95) of the recent response latencies of a Deployment is sent to a second replica. The first response is used and the other call is cancelled. Only use it for idempotent Executors. Disabled by default
         :param host: The host address of the runtime, by default it is 0.0.0.0. In the case of an external Executor (`--external` or `external=True`) this can be a list of hosts, separated by commas. Then, every resulting address will be considered as one replica of the Executor.
         :param log_config: The YAML config of the logger used in this object.
         :param metrics: If set, the sdk implementation of the OpenTelemetry metrics will be available for default monitoring and custom measurements. Otherwise a no-op implementation will be provided.
         :param metrics_exporter_host: If tracing is enabled, this hostname will be used to configure the metrics exporter agent.
         :param metrics_exporter_port: If tracing is enabled, this port will be used to configure the metrics exporter agent.
         :param monitoring: If set, spawn an http server with a prometheus endpoint to expose metrics
+        :param multiplex_requests: If set, the requests sent by this Pod to a Head or Executor go through one long-lived bidirectional gRPC stream per connection, instead of one gRPC call per request. Responses are matched to their requests by request_id. This reduces the per-call overhead for high QPS traffic of small requests, but with tracing enabled all the requests of a stream share the span of the stream
         :param name: The name of this object.
 
               This will be used in the following places:
@@ -420,6 +446,7 @@ class Flow(
         :param prefetch: Number of requests fetched from the client before feeding into the first Executor.
 
               Used to control the speed of data input into a Flow. 0 disables prefetch (1000 requests is the default)
+        :param prewarm_connections: If set, the connections of this Pod to a Head or Executor are established in the background as soon as they are added, and a replica only receives requests once its connection is ready. Otherwise, the connection is established by the first request sent to the replica
         :param protocol: Communication protocol between server and client.
         :param proxy: If set, respect the http_proxy and https_proxy environment variables. otherwise, it will unset these proxy variables before start. gRPC seems to prefer no proxy
         :param py_modules: The customized python modules need to be imported before loading the gateway
@@ -430,6 +457,7 @@ class Flow(
         :param quiet: If set, then no log will be emitted from this object.
         :param quiet_error: If set, then exception stack information will not be added to the log
         :param retries: Number of retries per gRPC call. If <0 it defaults to max(3, num_replicas)
+        :param retry_budget: If set, the maximum fraction of the requests (e.g. 0.1) that can be retried, shared by all the requests sent by this Pod. Retries beyond the budget are not sent and the request fails immediately, which prevents retry storms during partial outages. Disabled by default
         :param runtime_cls: The runtime class to run inside the Pod
         :param ssl_certfile: the path to the certificate file
         :param ssl_keyfile: the path to the key file
@@ -598,6 +626,7 @@ class Flow(
         deployments_metadata: Dict[str, Dict[str, str]],
         graph_conditions: Dict[str, Dict],
         deployments_no_reduce: List[str],
+        deployments_load_balancing: Dict[str, str],
         **kwargs,
     ):
         kwargs.update(
@@ -626,6 +655,7 @@ class Flow(
         args.deployments_addresses = json.dumps(deployments_addresses)
         args.deployments_metadata = json.dumps(deployments_metadata)
         args.deployments_no_reduce = json.dumps(deployments_no_reduce)
+        args.deployments_load_balancing = json.dumps(deployments_load_balancing)
         self._deployment_nodes[GATEWAY_NAME] = Deployment(args, needs)
 
     def _get_deployments_metadata(self) -> Dict[str, Dict[str, str]]:
@@ -754,6 +784,15 @@ class Flow(
 
         return disabled_deployments
 
+    def _get_deployments_load_balancing(self) -> Dict[str, str]:
+        deployments_load_balancing = {}
+        for node, v in self._deployment_nodes.items():
+            load_balancing = getattr(v.args, 'load_balancing', None)
+            if load_balancing and load_balancing != LoadBalancingType.ROUND_ROBIN:
+                deployments_load_balancing[node] = str(load_balancing)
+
+        return deployments_load_balancing
+
     def _get_graph_representation(self) -> Dict[str, List[str]]:
         def _add_node(graph, n):
             # in the graph we need to distinguish between start and end gateway, although they are the same deployment
@@ -827,6 +866,9 @@ class Flow(
     def add(
         self,
         *,
+        circuit_breaker_error_rate: Optional[float] = None,
+        circuit_breaker_failures: Optional[int] = None,
+        circuit_breaker_probe_interval: Optional[float] = 1.0,
         compression: Optional[str] = None,
         connection_list: Optional[str] = None,
         disable_auto_volume: Optional[bool] = False,
@@ -840,13 +882,17 @@ class Flow(
         gpus: Optional[str] = None,
         grpc_metadata: Optional[dict] = None,
         grpc_server_options: Optional[dict] = None,
+        hedging_budget: Optional[float] = 0.1,
+        hedging_percentile: Optional[float] = None,
         host: Optional[str] = '0.0.0.0',
         install_requirements: Optional[bool] = False,
+        load_balancing: Optional[str] = 'ROUND_ROBIN',
         log_config: Optional[str] = None,
         metrics: Optional[bool] = False,
         metrics_exporter_host: Optional[str] = None,
         metrics_exporter_port: Optional[int] = None,
         monitoring: Optional[bool] = False,
+        multiplex_requests: Optional[bool] = False,
         name: Optional[str] = None,
         native: Optional[bool] = False,
         no_reduce: Optional[bool] = False,
@@ -854,12 +900,14 @@ class Flow(
         polling: Optional[str] = 'ANY',
         port: Optional[str] = None,
         port_monitoring: Optional[str] = None,
+        prewarm_connections: Optional[bool] = False,
         py_modules: Optional[List[str]] = None,
         quiet: Optional[bool] = False,
         quiet_error: Optional[bool] = False,
         quiet_remote_logs: Optional[bool] = False,
         replicas: Optional[int] = 1,
         retries: Optional[int] = -1,
+        retry_budget: Optional[float] = None,
         runtime_cls: Optional[str] = 'WorkerRuntime',
         shards: Optional[int] = 1,
         timeout_ctrl: Optional[int] = 60,
@@ -885,6 +933,9 @@ class Flow(
     ) -> Union['Flow', 'AsyncFlow']:
         """Add an Executor to the current Flow object.
 
+        :param circuit_breaker_error_rate: If set, a replica is ejected from the load balancing when the fraction of failed gRPC calls among its recent calls reaches this value (e.g. 0.5). Ejected replicas are health checked and let back in once they are serving again. Disabled by default
+        :param circuit_breaker_failures: If set, a replica is ejected from the load balancing after this many consecutive failed gRPC calls. Ejected replicas are health checked and let back in once they are serving again. Disabled by default
+        :param circuit_breaker_probe_interval: The interval in seconds between two health checks of an ejected replica
         :param compression: The compression mechanism used when sending requests from the Head to the WorkerRuntimes. For more details, check https://grpc.github.io/grpc/python/grpc.html#compression.
         :param connection_list: dictionary JSON with a list of connections to configure
         :param disable_auto_volume: Do not automatically mount a volume for dockerized Executors.
@@ -908,13 +959,20 @@ class Flow(
               - To specify more parameters, use `--gpus device=[YOUR-GPU-DEVICE-ID],runtime=nvidia,capabilities=display
         :param grpc_metadata: The metadata to be passed to the gRPC request.
         :param grpc_server_options: Dictionary of kwargs arguments that will be passed to the grpc server as options when starting the server, example : {'grpc.max_send_message_length': -1}
+        :param hedging_budget: The maximum fraction of the requests that can be sent to a second replica when `--hedging-percentile` is set
+        :param hedging_percentile: If set, a request that did not get a response after this percentile (e.g. 95) of the recent response latencies of a Deployment is sent to a second replica. The first response is used and the other call is cancelled. Only use it for idempotent Executors. Disabled by default
         :param host: The host address of the runtime, by default it is 0.0.0.0. In the case of an external Executor (`--external` or `external=True`) this can be a list of hosts, separated by commas. Then, every resulting address will be considered as one replica of the Executor.
         :param install_requirements: If set, install `requirements.txt` in the Hub Executor bundle to local
+        :param load_balancing: The strategy used to select the replica that receives a request when the Deployment has `replicas>1`.
+              - ROUND_ROBIN: the replicas receive the requests one after another
+              - LEAST_OUTSTANDING: the replica with the fewest requests in flight receives the request
+              - LATENCY_AWARE: the faster of two randomly picked replicas receives the request, based on the moving average of their response latency
         :param log_config: The YAML config of the logger used in this object.
         :param metrics: If set, the sdk implementation of the OpenTelemetry metrics will be available for default monitoring and custom measurements. Otherwise a no-op implementation will be provided.
         :param metrics_exporter_host: If tracing is enabled, this hostname will be used to configure the metrics exporter agent.
         :param metrics_exporter_port: If tracing is enabled, this port will be used to configure the metrics exporter agent.
         :param monitoring: If set, spawn an http server with a prometheus endpoint to expose metrics
+        :param multiplex_requests: If set, the requests sent by this Pod to a Head or Executor go through one long-lived bidirectional gRPC stream per connection, instead of one gRPC call per request. Responses are matched to their requests by request_id. This reduces the per-call overhead for high QPS traffic of small requests, but with tracing enabled all the requests of a stream share the span of the stream
         :param name: The name of this object.
 
               This will be used in the following places:
@@ -941,6 +999,7 @@ class Flow(
               {'/custom': 'ALL', '/search': 'ANY', '*': 'ANY'}
         :param port: The port for input data to bind to, default is a random port between [49152, 65535].In the case of an external Executor (`--external` or `external=True`) this can be a list of ports, separated by commas.  Then, every resulting address will be considered as one replica of the Executor.
         :param port_monitoring: The port on which the prometheus server is exposed, default is a random port between [49152, 65535]
+        :param prewarm_connections: If set, the connections of this Pod to a Head or Executor are established in the background as soon as they are added, and a replica only receives requests once its connection is ready. Otherwise, the connection is established by the first request sent to the replica
         :param py_modules: The customized python modules need to be imported before loading the executor
 
           Note that the recommended way is to only import a single module - a simple python file, if your
@@ -952,6 +1011,7 @@ class Flow(
         :param quiet_remote_logs: Do not display the streaming of remote logs on local console
         :param replicas: The number of replicas in the deployment
         :param retries: Number of retries per gRPC call. If <0 it defaults to max(3, num_replicas)
+        :param retry_budget: If set, the maximum fraction of the requests (e.g. 0.1) that can be retried, shared by all the requests sent by this Pod. Retries beyond the budget are not sent and the request fails immediately, which prevents retry storms during partial outages. Disabled by default
         :param runtime_cls: The runtime class to run inside the Pod
         :param shards: The number of shards in the deployment running at the same time. For more details check https://docs.jina.ai/fundamentals/flow/create-flow/#complex-flow-topologies
         :param timeout_ctrl: The timeout in milliseconds of the control request, -1 for waiting forever
@@ -1040,6 +1100,9 @@ class Flow(
         """Add a Deployment to the current Flow object and return the new modified Flow object.
         The attribute of the Deployment can be later changed with :py:meth:`set` or deleted with :py:meth:`remove`
 
+        :param circuit_breaker_error_rate: If set, a replica is ejected from the load balancing when the fraction of failed gRPC calls among its recent calls reaches this value (e.g. 0.5). Ejected replicas are health checked and let back in once they are serving again. Disabled by default
+        :param circuit_breaker_failures: If set, a replica is ejected from the load balancing after this many consecutive failed gRPC calls. Ejected replicas are health checked and let back in once they are serving again. Disabled by default
+        :param circuit_breaker_probe_interval: The interval in seconds between two health checks of an ejected replica
         :param compression: The compression mechanism used when sending requests from the Head to the WorkerRuntimes. For more details, check https://grpc.github.io/grpc/python/grpc.html#compression.
         :param connection_list: dictionary JSON with a list of connections to configure
         :param disable_auto_volume: Do not automatically mount a volume for dockerized Executors.
@@ -1063,13 +1126,20 @@ class Flow(
               - To specify more parameters, use `--gpus device=[YOUR-GPU-DEVICE-ID],runtime=nvidia,capabilities=display
         :param grpc_metadata: The metadata to be passed to the gRPC request.
         :param grpc_server_options: Dictionary of kwargs arguments that will be passed to the grpc server as options when starting the server, example : {'grpc.max_send_message_length': -1}
+        :param hedging_budget: The maximum fraction of the requests that can be sent to a second replica when `--hedging-percentile` is set
+        :param hedging_percentile: If set, a request that did not get a response after this percentile (e.g. 95) of the recent response latencies of a Deployment is sent to a second replica. The first response is used and the other call is cancelled. Only use it for idempotent Executors. Disabled by default
         :param host: The host address of the runtime, by default it is 0.0.0.0. In the case of an external Executor (`--external` or `external=True`) this can be a list of hosts, separated by commas. Then, every resulting address will be considered as one replica of the Executor.
         :param install_requirements: If set, install `requirements.txt` in the Hub Executor bundle to local
+        :param load_balancing: The strategy used to select the replica that receives a request when the Deployment has `replicas>1`.
+              - ROUND_ROBIN: the replicas receive the requests one after another
+              - LEAST_OUTSTANDING: the replica with the fewest requests in flight receives the request
+              - LATENCY_AWARE: the faster of two randomly picked replicas receives the request, based on the moving average of their response latency
         :param log_config: The YAML config of the logger used in this object.
         :param metrics: If set, the sdk implementation of the OpenTelemetry metrics will be available for default monitoring and custom measurements. Otherwise a no-op implementation will be provided.
         :param metrics_exporter_host: If tracing is enabled, this hostname will be used to configure the metrics exporter agent.
         :param metrics_exporter_port: If tracing is enabled, this port will be used to configure the metrics exporter agent.
         :param monitoring: If set, spawn an http server with a prometheus endpoint to expose metrics
+        :param multiplex_requests: If set, the requests sent by this Pod to a Head or Executor go through one long-lived bidirectional gRPC stream per connection, instead of one gRPC call per request. Responses are matched to their requests by request_id. This reduces the per-call overhead for high QPS traffic of small requests, but with tracing enabled all the requests of a stream share the span of the stream
         :param name: The name of this object.
 
               This will be used in the following places:
@@ -1096,6 +1166,7 @@ class Flow(
               {'/custom': 'ALL', '/search': 'ANY', '*': 'ANY'}
         :param port: The port for input data to bind to, default is a random port between [49152, 65535].In the case of an external Executor (`--external` or `external=True`) this can be a list of ports, separated by commas.  Then, every resulting address will be considered as one replica of the Executor.
         :param port_monitoring: The port on which the prometheus server is exposed, default is a random port between [49152, 65535]
+        :param prewarm_connections: If set, the connections of this Pod to a Head or Executor are established in the background as soon as they are added, and a replica only receives requests once its connection is ready. Otherwise, the connection is established by the first request sent to the replica
         :param py_modules: The customized python modules need to be imported before loading the executor
 
           Note that the recommended way is to only import a single module - a simple python file, if your
@@ -1107,6 +1178,7 @@ class Flow(
         :param quiet_remote_logs: Do not display the streaming of remote logs on local console
         :param replicas: The number of replicas in the deployment
         :param retries: Number of retries per gRPC call. If <0 it defaults to max(3, num_replicas)
+        :param retry_budget: If set, the maximum fraction of the requests (e.g. 0.1) that can be retried, shared by all the requests sent by this Pod. Retries beyond the budget are not sent and the request fails immediately, which prevents retry storms during partial outages. Disabled by default
         :param runtime_cls: The runtime class to run inside the Pod
         :param shards: The number of shards in the deployment running at the same time. For more details check https://docs.jina.ai/fundamentals/flow/create-flow/#complex-flow-topologies
         :param timeout_ctrl: The timeout in milliseconds of the control request, -1 for waiting forever
@@ -1247,9 +1319,13 @@ class Flow(
     def config_gateway(
         self,
         *,
+        circuit_breaker_error_rate: Optional[float] = None,
+        circuit_breaker_failures: Optional[int] = None,
+        circuit_breaker_probe_interval: Optional[float] = 1.0,
         compression: Optional[str] = None,
         cors: Optional[bool] = False,
         deployments_addresses: Optional[str] = '{}',
+        deployments_load_balancing: Optional[str] = '{}',
         deployments_metadata: Optional[str] = '{}',
         deployments_no_reduce: Optional[str] = '[]',
         description: Optional[str] = None,
@@ -1262,24 +1338,29 @@ class Flow(
         graph_conditions: Optional[str] = '{}',
         graph_description: Optional[str] = '{}',
         grpc_server_options: Optional[dict] = None,
+        hedging_budget: Optional[float] = 0.1,
+        hedging_percentile: Optional[float] = None,
         host: Optional[str] = '0.0.0.0',
         log_config: Optional[str] = None,
         metrics: Optional[bool] = False,
         metrics_exporter_host: Optional[str] = None,
         metrics_exporter_port: Optional[int] = None,
         monitoring: Optional[bool] = False,
+        multiplex_requests: Optional[bool] = False,
         name: Optional[str] = 'gateway',
         no_crud_endpoints: Optional[bool] = False,
         no_debug_endpoints: Optional[bool] = False,
         port: Optional[str] = None,
         port_monitoring: Optional[str] = None,
         prefetch: Optional[int] = 1000,
+        prewarm_connections: Optional[bool] = False,
         protocol: Optional[str] = 'GRPC',
         proxy: Optional[bool] = False,
         py_modules: Optional[List[str]] = None,
         quiet: Optional[bool] = False,
         quiet_error: Optional[bool] = False,
         retries: Optional[int] = -1,
+        retry_budget: Optional[float] = None,
         runtime_cls: Optional[str] = 'GatewayRuntime',
         ssl_certfile: Optional[str] = None,
         ssl_keyfile: Optional[str] = None,
@@ -1298,9 +1379,13 @@ class Flow(
     ):
         """Configure the Gateway inside a Flow. The Gateway exposes your Flow logic as a service to the internet according to the protocol and configuration you choose.
 
+        :param circuit_breaker_error_rate: If set, a replica is ejected from the load balancing when the fraction of failed gRPC calls among its recent calls reaches this value (e.g. 0.5). Ejected replicas are health checked and let back in once they are serving again. Disabled by default
+        :param circuit_breaker_failures: If set, a replica is ejected from the load balancing after this many consecutive failed gRPC calls. Ejected replicas are health checked and let back in once they are serving again. Disabled by default
+        :param circuit_breaker_probe_interval: The interval in seconds between two health checks of an ejected replica
         :param compression: The compression mechanism used when sending requests from the Head to the WorkerRuntimes. For more details, check https://grpc.github.io/grpc/python/grpc.html#compression.
         :param cors: If set, a CORS middleware is added to FastAPI frontend to allow cross-origin access.
         :param deployments_addresses: JSON dictionary with the input addresses of each Deployment
+        :param deployments_load_balancing: JSON dictionary with the load balancing strategy used to select the replicas of each Deployment
         :param deployments_metadata: JSON dictionary with the request metadata for each Deployment
         :param deployments_no_reduce: list JSON disabling the built-in merging mechanism for each Deployment listed
         :param description: The description of this HTTP server. It will be used in automatics docs such as Swagger UI.
@@ -1316,12 +1401,15 @@ class Flow(
         :param graph_conditions: Dictionary stating which filtering conditions each Executor in the graph requires to receive Documents.
         :param graph_description: Routing graph for the gateway
         :param grpc_server_options: Dictionary of kwargs arguments that will be passed to the grpc server as options when starting the server, example : {'grpc.max_send_message_length': -1}
+        :param hedging_budget: The maximum fraction of the requests that can be sent to a second replica when `--hedging-percentile` is set
+        :param hedging_percentile: If set, a request that did not get a response after this percentile (e.g. 95) of the recent response latencies of a Deployment is sent to a second replica. The first response is used and the other call is cancelled. Only use it for idempotent Executors. Disabled by default
         :param host: The host address of the runtime, by default it is 0.0.0.0. In the case of an external Executor (`--external` or `external=True`) this can be a list of hosts, separated by commas. Then, every resulting address will be considered as one replica of the Executor.
         :param log_config: The YAML config of the logger used in this object.
         :param metrics: If set, the sdk implementation of the OpenTelemetry metrics will be available for default monitoring and custom measurements. Otherwise a no-op implementation will be provided.
         :param metrics_exporter_host: If tracing is enabled, this hostname will be used to configure the metrics exporter agent.
         :param metrics_exporter_port: If tracing is enabled, this port will be used to configure the metrics exporter agent.
         :param monitoring: If set, spawn an http server with a prometheus endpoint to expose metrics
+        :param multiplex_requests: If set, the requests sent by this Pod to a Head or Executor go through one long-lived bidirectional gRPC stream per connection, instead of one gRPC call per request. Responses are matched to their requests by request_id. This reduces the per-call overhead for high QPS traffic of small requests, but with tracing enabled all the requests of a stream share the span of the stream
         :param name: The name of this object.
 
               This will be used in the following places:
@@ -1340,6 +1428,7 @@ class Flow(
         :param prefetch: Number of requests fetched from the client before feeding into the first Executor.
 
               Used to control the speed of data input into a Flow. 0 disables prefetch (1000 requests is the default)
+        :param prewarm_connections: If set, the connections of this Pod to a Head or Executor are established in the background as soon as they are added, and a replica only receives requests once its connection is ready. Otherwise, the connection is established by the first request sent to the replica
         :param protocol: Communication protocol between server and client.
         :param proxy: If set, respect the http_proxy and https_proxy environment variables. otherwise, it will unset these proxy variables before start. gRPC seems to prefer no proxy
         :param py_modules: The customized python modules need to be imported before loading the gateway
@@ -1350,6 +1439,7 @@ class Flow(
         :param quiet: If set, then no log will be emitted from this object.
         :param quiet_error: If set, then exception stack information will not be added to the log
         :param retries: Number of retries per gRPC call. If <0 it defaults to max(3, num_replicas)
+        :param retry_budget: If set, the maximum fraction of the requests (e.g. 0.1) that can be retried, shared by all the requests sent by this Pod. Retries beyond the budget are not sent and the request fails immediately, which prevents retry storms during partial outages. Disabled by default
         :param runtime_cls: The runtime class to run inside the Pod
         :param ssl_certfile: the path to the certificate file
         :param ssl_keyfile: the path to the key file
@@ -1393,9 +1483,13 @@ class Flow(
 
         """Configure the Gateway inside a Flow. The Gateway exposes your Flow logic as a service to the internet according to the protocol and configuration you choose.
 
+        :param circuit_breaker_error_rate: If set, a replica is ejected from the load balancing when the fraction of failed gRPC calls among its recent calls reaches this value (e.g. 0.5). Ejected replicas are health checked and let back in once they are serving again. Disabled by default
+        :param circuit_breaker_failures: If set, a replica is ejected from the load balancing after this many consecutive failed gRPC calls. Ejected replicas are health checked and let back in once they are serving again. Disabled by default
+        :param circuit_breaker_probe_interval: The interval in seconds between two health checks of an ejected replica
         :param compression: The compression mechanism used when sending requests from the Head to the WorkerRuntimes. For more details, check https://grpc.github.io/grpc/python/grpc.html#compression.
         :param cors: If set, a CORS middleware is added to FastAPI frontend to allow cross-origin access.
         :param deployments_addresses: JSON dictionary with the input addresses of each Deployment
+        :param deployments_load_balancing: JSON dictionary with the load balancing strategy used to select the replicas of each Deployment
         :param deployments_metadata: JSON dictionary with the request metadata for each Deployment
         :param deployments_no_reduce: list JSON disabling the built-in merging mechanism for each Deployment listed
         :param description: The description of this HTTP server. It will be used in automatics docs such as Swagger UI.
@@ -1411,12 +1505,15 @@ class Flow(
         :param graph_conditions: Dictionary stating which filtering conditions each Executor in the graph requires to receive Documents.
         :param graph_description: Routing graph for the gateway
         :param grpc_server_options: Dictionary of kwargs arguments that will be passed to the grpc server as options when starting the server, example : {'grpc.max_send_message_length': -1}
+        :param hedging_budget: The maximum fraction of the requests that can be sent to a second replica when `--hedging-percentile` is set
+        :param hedging_percentile: If set, a request that did not get a response after this percentile (e.g. 95) of the recent response latencies of a Deployment is sent to a second replica. The first response is used and the other call is cancelled. Only use it for idempotent Executors. Disabled by default
         :param host: The host address of the runtime, by default it is 0.0.0.0. In the case of an external Executor (`--external` or `external=True`) this can be a list of hosts, separated by commas. Then, every resulting address will be considered as one replica of the Executor.
         :param log_config: The YAML config of the logger used in this object.
         :param metrics: If set, the sdk implementation of the OpenTelemetry metrics will be available for default monitoring and custom measurements. Otherwise a no-op implementation will be provided.
         :param metrics_exporter_host: If tracing is enabled, this hostname will be used to configure the metrics exporter agent.
         :param metrics_exporter_port: If tracing is enabled, this port will be used to configure the metrics exporter agent.
         :param monitoring: If set, spawn an http server with a prometheus endpoint to expose metrics
+        :param multiplex_requests: If set, the requests sent by this Pod to a Head or Executor go through one long-lived bidirectional gRPC stream per connection, instead of one gRPC call per request. Responses are matched to their requests by request_id. This reduces the per-call overhead for high QPS traffic of small requests, but with tracing enabled all the requests of a stream share the span of the stream
         :param name: The name of this object.
 
               This will be used in the following places:
@@ -1435,6 +1532,7 @@ class Flow(
         :param prefetch: Number of requests fetched from the client before feeding into the first Executor.
 
               Used to control the speed of data input into a Flow. 0 disables prefetch (1000 requests is the default)
+        :param prewarm_connections: If set, the connections of this Pod to a Head or Executor are established in the background as soon as they are added, and a replica only receives requests once its connection is ready. Otherwise, the connection is established by the first request sent to the replica
         :param protocol: Communication protocol between server and client.
         :param proxy: If set, respect the http_proxy and https_proxy environment variables. otherwise, it will unset these proxy variables before start. gRPC seems to prefer no proxy
         :param py_modules: The customized python modules need to be imported before loading the gateway
@@ -1445,6 +1543,7 @@ class Flow(
         :param quiet: If set, then no log will be emitted from this object.
         :param quiet_error: If set, then exception stack information will not be added to the log
         :param retries: Number of retries per gRPC call. If <0 it defaults to max(3, num_replicas)
+        :param retry_budget: If set, the maximum fraction of the requests (e.g. 0.1) that can be retried, shared by all the requests sent by this Pod. Retries beyond the budget are not sent and the request fails immediately, which prevents retry storms during partial outages. Disabled by default
         :param runtime_cls: The runtime class to run inside the Pod
         :param ssl_certfile: the path to the certificate file
         :param ssl_keyfile: the path to the key file
@@ -1653,6 +1752,7 @@ class Flow(
                 deployments_metadata=op_flow._get_deployments_metadata(),
                 graph_conditions=op_flow._get_graph_conditions(),
                 deployments_no_reduce=op_flow._get_disabled_reduce_deployments(),
+                deployments_load_balancing=op_flow._get_deployments_load_balancing(),
                 uses=op_flow.gateway_args.uses,
             )
 
@@ -122,6 +122,74 @@ def mixin_pod_parser(parser, pod_type: str = 'worker'):
         help=f'Number of retries per gRPC call. If <0 it defaults to max(3, num_replicas)',
     )
 
+    gp.add_argument(
+        '--retry-budget',
+        type=float,
+        default=None,
+        help='If set, the maximum fraction of the requests (e.g. 0.1) that can be retried, shared by all the requests '
+        'sent by this Pod. Retries beyond the budget are not sent and the request fails immediately, which prevents '
+        'retry storms during partial outages. Disabled by default',
+    )
+
+    gp.add_argument(
+        '--hedging-percentile',
+        type=float,
+        default=None,
+        help='If set, a request that did not get a response after this percentile (e.g. 95) of the recent response '
+        'latencies of a Deployment is sent to a second replica. The first response is used and the other call is '
+        'cancelled. Only use it for idempotent Executors. Disabled by default',
+    )
+
+    gp.add_argument(
+        '--hedging-budget',
+        type=float,
+        default=0.1,
+        help='The maximum fraction of the requests that can be sent to a second replica when `--hedging-percentile` is set',
+    )
+
+    gp.add_argument(
+        '--circuit-breaker-failures',
+        type=int,
+        default=None,
+        help='If set, a replica is ejected from the load balancing after this many consecutive failed gRPC calls. '
+        'Ejected replicas are health checked and let back in once they are serving again. Disabled by default',
+    )
+
+    gp.add_argument(
+        '--circuit-breaker-error-rate',
+        type=float,
+        default=None,
+        help='If set, a replica is ejected from the load balancing when the fraction of failed gRPC calls among its '
+        'recent calls reaches this value (e.g. 0.5). Ejected replicas are health checked and let back in once they '
+        'are serving again. Disabled by default',
+    )
+
+    gp.add_argument(
+        '--circuit-breaker-probe-interval',
+        type=float,
+        default=1.0,
+        help='The interval in seconds between two health checks of an ejected replica',
+    )
+
+    gp.add_argument(
+        '--multiplex-requests',
+        action='store_true',
+        default=False,
+        help='If set, the requests sent by this Pod to a Head or Executor go through one long-lived bidirectional gRPC '
+        'stream per connection, instead of one gRPC call per request. Responses are matched to their requests by '
+        'request_id. This reduces the per-call overhead for high QPS traffic of small requests, but with tracing '
+        'enabled all the requests of a stream share the span of the stream',
+    )
+
+    gp.add_argument(
+        '--prewarm-connections',
+        action='store_true',
+        default=False,
+        help='If set, the connections of this Pod to a Head or Executor are established in the background as soon '
+        'as they are added, and a replica only receives requests once its connection is ready. Otherwise, the '
+        'connection is established by the first request sent to the replica',
+    )
+
     gp.add_argument(
         '--floating',
         action='store_true',
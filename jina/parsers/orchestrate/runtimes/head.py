@@ -1,3 +1,4 @@
+from jina.enums import LoadBalancingType
 from jina.parsers.helper import add_arg_group
 
 
@@ -39,3 +40,16 @@ def mixin_head_parser(parser):
         default=None,
         help='The timeout in milliseconds used when sending data requests to Executors, -1 means no timeout, disabled by default',
     )
+
+    gp.add_argument(
+        '--load-balancing',
+        type=LoadBalancingType.from_string,
+        choices=list(LoadBalancingType),
+        default=LoadBalancingType.ROUND_ROBIN,
+        help='''
+    The strategy used to select the replica that receives a request when the Deployment has `replicas>1`.
+    - ROUND_ROBIN: the replicas receive the requests one after another
+    - LEAST_OUTSTANDING: the replica with the fewest requests in flight receives the request
+    - LATENCY_AWARE: the faster of two randomly picked replicas receives the request, based on the moving average of their response latency
+    ''',
+    )
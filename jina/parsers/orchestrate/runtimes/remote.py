@@ -133,6 +133,13 @@ which should be structured as a python package.
         default='[]',
     )
 
+    parser.add_argument(
+        '--deployments-load-balancing',
+        type=str,
+        help='JSON dictionary with the load balancing strategy used to select the replicas of each Deployment',
+        default='{}',
+    )
+
     gp.add_argument(
         '--compression',
         choices=['NoCompression', 'Deflate', 'Gzip'],
@@ -1,10 +1,65 @@
-import os
-from typing import Iterable, List, Union
+import threading
+from contextvars import ContextVar
+from typing import Iterable, List, Optional, Union
 
 from jina.proto import jina_pb2
 from jina.types.request.data import DataRequest
 
 
+class BytesCounter:
+    """Counts the bytes of the DataRequests serialized and deserialized by gRPC in the memory of the process.
+
+    The counting methods are called on every message, subclasses overriding them to export the counts must keep them
+    cheap
+    """
+
+    def __init__(self):
+        self.sent_bytes = 0
+        self.received_bytes = 0
+        self._lock = threading.Lock()
+
+    def add_sent_bytes(self, nbytes: int):
+        """
+        Count bytes of serialized DataRequests
+
+        :param nbytes: the number of bytes
+        """
+        with self._lock:
+            self.sent_bytes += nbytes
+
+    def add_received_bytes(self, nbytes: int):
+        """
+        Count bytes of deserialized DataRequests
+
+        :param nbytes: the number of bytes
+        """
+        with self._lock:
+            self.received_bytes += nbytes
+
+
+# counts the bytes of all the DataRequests sent and received by this process
+process_bytes_counter = BytesCounter()
+# counts the bytes of the DataRequests sent and received through the connection used in the current context, it is set
+# around the gRPC calls so that the serializer, which does not know the channel, can do the accounting per connection
+connection_bytes_counter: ContextVar[Optional[BytesCounter]] = ContextVar(
+    'connection_bytes_counter', default=None
+)
+
+
+def _count_sent_bytes(nbytes: int):
+    process_bytes_counter.add_sent_bytes(nbytes)
+    counter = connection_bytes_counter.get()
+    if counter is not None:
+        counter.add_sent_bytes(nbytes)
+
+
+def _count_received_bytes(nbytes: int):
+    process_bytes_counter.add_received_bytes(nbytes)
+    counter = connection_bytes_counter.get()
+    if counter is not None:
+        counter.add_received_bytes(nbytes)
+
+
 class DataRequestProto:
     """This class is a drop-in replacement for gRPC default serializer.
 
@@ -23,9 +78,7 @@ class DataRequestProto:
             r = x.buffer
         else:
             r = x.proto.SerializePartialToString()
-        os.environ['JINA_GRPC_SEND_BYTES'] = str(
-            len(r) + int(os.environ.get('JINA_GRPC_SEND_BYTES', 0))
-        )
+        _count_sent_bytes(len(r))
         return r
 
     @staticmethod
@@ -35,9 +88,7 @@ class DataRequestProto:
         # noqa: DAR102
         # noqa: DAR201
         """
-        os.environ['JINA_GRPC_RECV_BYTES'] = str(
-            len(x) + int(os.environ.get('JINA_GRPC_RECV_BYTES', 0))
-        )
+        _count_received_bytes(len(x))
         return DataRequest(x)
 
 
@@ -61,7 +112,9 @@ class DataRequestListProto:
         else:
             protos = [r.proto_with_data for r in x]
 
-        return jina_pb2.DataRequestListProto(requests=protos).SerializeToString()
+        r = jina_pb2.DataRequestListProto(requests=protos).SerializeToString()
+        _count_sent_bytes(len(r))
+        return r
 
     @staticmethod
     def FromString(x: bytes):
@@ -70,6 +123,7 @@ class DataRequestListProto:
         # noqa: DAR102
         # noqa: DAR201
         """
+        _count_received_bytes(len(x))
         rlp = jina_pb2.DataRequestListProto()
         rlp.ParseFromString(x)
         return [DataRequest.from_proto(request) for request in rlp.requests]
@@ -114,6 +114,7 @@ class BaseGateway(JAMLCompatible, metaclass=GatewayType):
         deployments_addresses = json.loads(args.deployments_addresses)
         deployments_metadata = json.loads(args.deployments_metadata)
         deployments_no_reduce = json.loads(args.deployments_no_reduce)
+        deployments_load_balancing = json.loads(args.deployments_load_balancing)
 
         self.streamer = GatewayStreamer(
             graph_representation=graph_description,
@@ -121,8 +122,17 @@ class BaseGateway(JAMLCompatible, metaclass=GatewayType):
             graph_conditions=graph_conditions,
             deployments_metadata=deployments_metadata,
             deployments_no_reduce=deployments_no_reduce,
+            deployments_load_balancing=deployments_load_balancing,
             timeout_send=timeout_send,
             retries=args.retries,
+            hedging_percentile=args.hedging_percentile,
+            hedging_budget=args.hedging_budget,
+            circuit_breaker_failures=args.circuit_breaker_failures,
+            circuit_breaker_error_rate=args.circuit_breaker_error_rate,
+            circuit_breaker_probe_interval=args.circuit_breaker_probe_interval,
+            retry_budget=args.retry_budget,
+            multiplex_requests=args.multiplex_requests,
+            prewarm_connections=args.prewarm_connections,
             compression=args.compression,
             runtime_name=runtime_name,
             prefetch=args.prefetch,
@@ -1,7 +1,9 @@
 import asyncio
 import ipaddress
 import os
-from collections import defaultdict
+import random
+import time
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
 from urllib.parse import urlparse
@@ -13,12 +15,21 @@ from grpc_reflection.v1alpha.reflection_pb2 import ServerReflectionRequest
 from grpc_reflection.v1alpha.reflection_pb2_grpc import ServerReflectionStub
 
 from jina import __default_endpoint__
-from jina.enums import PollingType
-from jina.excepts import EstablishGrpcConnectionError, InternalNetworkError
+from jina.enums import LoadBalancingType, PollingType
+from jina.excepts import (
+    EstablishGrpcConnectionError,
+    InternalNetworkError,
+    RequestDeadlineExceeded,
+)
 from jina.importer import ImportExtensions
 from jina.logging.logger import JinaLogger
+from jina.proto.serializer import BytesCounter, connection_bytes_counter
 from jina.proto import jina_pb2, jina_pb2_grpc
 from jina.serve.instrumentation import MetricsTimer
+from jina.serve.runtimes.helper import (
+    _get_data_stream_status,
+    _get_remaining_timeout,
+)
 from jina.types.request import Request
 from jina.types.request.data import DataRequest
 
@@ -31,12 +42,34 @@ if TYPE_CHECKING:  # pragma: no cover
     from opentelemetry.instrumentation.grpc._client import (
         OpenTelemetryClientInterceptor,
     )
-    from opentelemetry.metrics import Histogram, Meter
-    from prometheus_client import CollectorRegistry, Summary
+    from opentelemetry.metrics import Counter, Histogram, Meter, UpDownCounter
+    from prometheus_client import CollectorRegistry, Gauge, Summary
+    from prometheus_client import Counter as PrometheusCounter
 
 
 DEFAULT_MINIMUM_RETRIES = 3
 GRACE_PERIOD_DESTROY_CONNECTION = 0.5
+# weight of the newest observation in the moving average of the response latency of a replica
+LATENCY_EWMA_ALPHA = 0.3
+# number of recent response latencies kept per replica list to compute the hedging delay
+LATENCY_WINDOW_SIZE = 100
+# no request is hedged before this many response latencies have been observed
+MIN_LATENCY_SAMPLES_FOR_HEDGING = 10
+# number of recent call outcomes kept per replica to compute its error rate for the circuit breaker
+ERROR_RATE_WINDOW_SIZE = 20
+# maximum time a request waits for a pre-warmed connection to get ready when no replica is ready yet
+WARMUP_WAIT_TIMEOUT = 10.0
+# pre-warmed channels usually connect before the target is serving, a short reconnect backoff avoids that the replica
+# only gets ready long after the target started serving
+WARMUP_GRPC_OPTIONS = [
+    ('grpc.initial_reconnect_backoff_ms', 100),
+    ('grpc.max_reconnect_backoff_ms', 1000),
+]
+# gRPC status codes of calls that count as failures of the replica for the circuit breaker
+CIRCUIT_BREAKER_FAILURE_CODES = {
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+}
 
 default_endpoints_proto = jina_pb2.EndpointsProto()
 default_endpoints_proto.endpoints.extend([__default_endpoint__])
@@ -51,6 +84,13 @@ class _NetworkingMetrics:
     sending_requests_time_metrics: Optional['Summary']
     received_response_bytes: Optional['Summary']
     send_requests_bytes_metrics: Optional['Summary']
+    pending_requests_metrics: Optional['Gauge'] = None
+    hedged_requests_metrics: Optional['PrometheusCounter'] = None
+    won_hedged_requests_metrics: Optional['PrometheusCounter'] = None
+    ejected_replicas_metrics: Optional['Gauge'] = None
+    retry_budget_exhausted_metrics: Optional['PrometheusCounter'] = None
+    sent_bytes_metrics: Optional['PrometheusCounter'] = None
+    received_bytes_metrics: Optional['PrometheusCounter'] = None
 
 
 @dataclass
@@ -62,6 +102,13 @@ class _NetworkingHistograms:
     sending_requests_time_metrics: Optional['Histogram'] = None
     received_response_bytes: Optional['Histogram'] = None
     send_requests_bytes_metrics: Optional['Histogram'] = None
+    pending_requests_metrics: Optional['UpDownCounter'] = None
+    hedged_requests_metrics: Optional['Counter'] = None
+    won_hedged_requests_metrics: Optional['Counter'] = None
+    ejected_replicas_metrics: Optional['UpDownCounter'] = None
+    retry_budget_exhausted_metrics: Optional['Counter'] = None
+    sent_bytes_metrics: Optional['Counter'] = None
+    received_bytes_metrics: Optional['Counter'] = None
     histogram_metric_labels: Dict[str, str] = None
 
     def _get_labels(self, additional_labels: Optional[Dict[str, str]] = None) -> Optional[Dict[str, str]]:
@@ -90,10 +137,134 @@ class _NetworkingHistograms:
         if self.send_requests_bytes_metrics:
             self.send_requests_bytes_metrics.record(value, labels)
 
+    def record_pending_requests_metrics(self, value: int, additional_labels: Optional[Dict[str, str]] = None):
+        labels = self._get_labels(additional_labels)
+
+        if self.pending_requests_metrics:
+            self.pending_requests_metrics.add(value, labels)
+
+    def record_hedged_requests_metrics(self, value: int, additional_labels: Optional[Dict[str, str]] = None):
+        labels = self._get_labels(additional_labels)
+
+        if self.hedged_requests_metrics:
+            self.hedged_requests_metrics.add(value, labels)
+
+    def record_won_hedged_requests_metrics(self, value: int, additional_labels: Optional[Dict[str, str]] = None):
+        labels = self._get_labels(additional_labels)
+
+        if self.won_hedged_requests_metrics:
+            self.won_hedged_requests_metrics.add(value, labels)
+
+    def record_ejected_replicas_metrics(self, value: int, additional_labels: Optional[Dict[str, str]] = None):
+        labels = self._get_labels(additional_labels)
+
+        if self.ejected_replicas_metrics:
+            self.ejected_replicas_metrics.add(value, labels)
+
+    def record_retry_budget_exhausted_metrics(self, value: int, additional_labels: Optional[Dict[str, str]] = None):
+        labels = self._get_labels(additional_labels)
+
+        if self.retry_budget_exhausted_metrics:
+            self.retry_budget_exhausted_metrics.add(value, labels)
+
+    def record_sent_bytes_metrics(self, value: int, additional_labels: Optional[Dict[str, str]] = None):
+        labels = self._get_labels(additional_labels)
+
+        if self.sent_bytes_metrics:
+            self.sent_bytes_metrics.add(value, labels)
+
+    def record_received_bytes_metrics(self, value: int, additional_labels: Optional[Dict[str, str]] = None):
+        labels = self._get_labels(additional_labels)
+
+        if self.received_bytes_metrics:
+            self.received_bytes_metrics.add(value, labels)
+
+
+class _ConnectionBytesCounter(BytesCounter):
+    """
+    Counts the bytes sent and received through one connection and exports them as metrics labeled with the deployment
+    and address of the connection
+    """
+
+    def __init__(
+        self,
+        metrics: _NetworkingMetrics,
+        histograms: _NetworkingHistograms,
+        runtime_name: str,
+        deployment_name: str,
+        address: str,
+    ):
+        super().__init__()
+        self._histograms = histograms
+        self._labels = {'deployment': deployment_name, 'address': address}
+        self._sent_bytes_metrics = (
+            metrics.sent_bytes_metrics.labels(runtime_name, deployment_name, address)
+            if metrics.sent_bytes_metrics
+            else None
+        )
+        self._received_bytes_metrics = (
+            metrics.received_bytes_metrics.labels(
+                runtime_name, deployment_name, address
+            )
+            if metrics.received_bytes_metrics
+            else None
+        )
+
+    def add_sent_bytes(self, nbytes: int):
+        super().add_sent_bytes(nbytes)
+        if self._sent_bytes_metrics:
+            self._sent_bytes_metrics.inc(nbytes)
+        self._histograms.record_sent_bytes_metrics(nbytes, self._labels)
+
+    def add_received_bytes(self, nbytes: int):
+        super().add_received_bytes(nbytes)
+        if self._received_bytes_metrics:
+            self._received_bytes_metrics.inc(nbytes)
+        self._histograms.record_received_bytes_metrics(nbytes, self._labels)
+
+
+class _RequestBudget:
+    """
+    Token bucket that limits additional requests, like hedged requests or retries, to a fraction of the regular
+    requests. Every regular request deposits `ratio` tokens and every additional request withdraws one token.
+
+    :param ratio: the maximum ratio of additional requests to regular requests
+    :param max_tokens: the maximum number of tokens that can be saved, limits the bursts of additional requests
+    :param initial_tokens: the number of tokens available before any regular request was made
+    """
+
+    DEFAULT_MAX_TOKENS = 10.0
+
+    def __init__(self, ratio: float, max_tokens: float = DEFAULT_MAX_TOKENS, initial_tokens: float = 0.0):
+        self.ratio = ratio
+        self._max_tokens = max_tokens
+        self._tokens = initial_tokens
+
+    def deposit(self):
+        """
+        Deposit the tokens earned by a regular request
+        """
+        self._tokens = min(self._tokens + self.ratio, self._max_tokens)
+
+    def withdraw(self) -> bool:
+        """
+        Withdraw the token needed by an additional request
+
+        :return: True if the additional request is within the budget, False otherwise
+        """
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
 
 class ReplicaList:
     """
-    Maintains a list of connections to replicas and uses round robin for selecting a replica
+    Maintains a list of connections to replicas and selects a replica according to the configured
+    :class:`LoadBalancingType`, round robin by default.
+    If a circuit breaker threshold is configured, failing replicas are ejected from the selection until a health
+    check shows that they are serving again.
+    If connections are pre-warmed, a new connection is only added to the selection once its channel is READY
     """
 
     def __init__(
@@ -104,8 +275,25 @@ class ReplicaList:
         runtime_name: str,
         aio_tracing_client_interceptors: Optional[Sequence['ClientInterceptor']] = None,
         tracing_client_interceptor: Optional['OpenTelemetryClientInterceptor'] = None,
+        load_balancing: LoadBalancingType = LoadBalancingType.ROUND_ROBIN,
+        circuit_breaker_failures: Optional[int] = None,
+        circuit_breaker_error_rate: Optional[float] = None,
+        circuit_breaker_probe_interval: float = 1.0,
+        multiplex_requests: bool = False,
+        prewarm_connections: bool = False,
     ):
         self.runtime_name = runtime_name
+        self.load_balancing = load_balancing
+        self._multiplex_requests = multiplex_requests
+        self._prewarm_connections = prewarm_connections
+        # connections that are being warmed up, they are not part of the selection yet
+        self._warming_connections = {}
+        self._warmup_tasks = {}
+        self._circuit_breaker_failures = circuit_breaker_failures
+        self._circuit_breaker_error_rate = circuit_breaker_error_rate
+        self._circuit_breaker_probe_interval = circuit_breaker_probe_interval
+        self._probing_tasks = set()
+        self._latencies = deque(maxlen=LATENCY_WINDOW_SIZE)
         self._connections = []
         self._address_to_connection_idx = {}
         self._address_to_channel = {}
@@ -160,11 +348,61 @@ class ReplicaList:
         :param address: Target address of this connection
         :param deployment_name: Target deployment of this connection
         """
-        if address not in self._address_to_connection_idx:
-            self._address_to_connection_idx[address] = len(self._connections)
+        if not self.has_connection(address):
             stubs, channel = self._create_connection(address, deployment_name)
-            self._address_to_channel[address] = channel
-            self._connections.append(stubs)
+            if self._prewarm_connections:
+                self._warming_connections[address] = (stubs, channel)
+                # connections can be added before the event loop of the runtime is running
+                self._warmup_tasks[address] = asyncio.get_event_loop().create_task(
+                    self._warm_up_connection(address, stubs, channel)
+                )
+            else:
+                self._add_to_rotation(address, stubs, channel)
+
+    def _add_to_rotation(
+        self,
+        address: str,
+        stubs: 'GrpcConnectionPool.ConnectionStubs',
+        channel: grpc.aio.Channel,
+    ):
+        self._address_to_connection_idx[address] = len(self._connections)
+        self._address_to_channel[address] = channel
+        self._connections.append(stubs)
+
+    async def _warm_up_connection(
+        self,
+        address: str,
+        stubs: 'GrpcConnectionPool.ConnectionStubs',
+        channel: grpc.aio.Channel,
+    ):
+        try:
+            await channel.channel_ready()
+            await stubs._init_stubs()
+            self._logger.debug(f'connection to {address} is warmed up')
+        except grpc.RpcError as e:
+            # the channel is READY, the stubs are resolved again on the first request
+            self._logger.debug(
+                f'resolving the services of {address} failed with code {e.code()} during warm up'
+            )
+        self._promote_warming_connection(address)
+
+    def _promote_warming_connection(self, address: str):
+        self._warmup_tasks.pop(address, None)
+        stubs, channel = self._warming_connections.pop(address)
+        self._add_to_rotation(address, stubs, channel)
+
+    async def _wait_for_warm_connection(self):
+        await asyncio.wait(
+            list(self._warmup_tasks.values()),
+            timeout=WARMUP_WAIT_TIMEOUT,
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        if not self._connections and self._warming_connections:
+            # no replica got ready in time, use a connection that is still warming up so that the request goes
+            # through the regular error handling instead of waiting forever
+            address = next(iter(self._warming_connections))
+            self._warmup_tasks[address].cancel()
+            self._promote_warming_connection(address)
 
     async def remove_connection(self, address: str) -> Union[grpc.aio.Channel, None]:
         """
@@ -179,6 +417,13 @@ class ReplicaList:
         :param address: Remove connection for this address
         :returns: The removed connection or None if there was not any for the given address
         """
+        if address in self._warming_connections:
+            self._warmup_tasks.pop(address).cancel()
+            popped_connection, closing_channel = self._warming_connections.pop(address)
+            await self._destroy_connection(
+                closing_channel, grace=GRACE_PERIOD_DESTROY_CONNECTION
+            )
+            return popped_connection
         if address in self._address_to_connection_idx:
             self._rr_counter = (
                 self._rr_counter % (len(self._connections) - 1)
@@ -213,6 +458,11 @@ class ReplicaList:
             histograms=self._histograms,
             tls=use_tls,
             aio_tracing_client_interceptors=self.aio_tracing_client_interceptors,
+            runtime_name=self.runtime_name,
+            multiplex_requests=self._multiplex_requests,
+            options=GrpcConnectionPool.get_default_grpc_options() + WARMUP_GRPC_OPTIONS
+            if self._prewarm_connections
+            else None,
         )
         return stubs, channel
 
@@ -222,7 +472,7 @@ class ReplicaList:
 
     async def get_next_connection(self, num_retries=3):
         """
-        Returns a connection from the list. Strategy is round robin
+        Returns a connection from the list. Strategy is defined by the `load_balancing` of this list
         :param num_retries: how many retries should be performed when all connections are currently unavailable
         :returns: A connection from the pool
         """
@@ -233,14 +483,10 @@ class ReplicaList:
         :param num_retries: how many retries should be performed when all connections are currently unavailable
         :returns: A connection from the pool
         """
+        if not self._connections and self._warmup_tasks:
+            await self._wait_for_warm_connection()
         try:
-            connection = None
-            for i in range(len(self._connections)):
-                internal_rr_counter = (self._rr_counter + i) % len(self._connections)
-                connection = self._connections[internal_rr_counter]
-                # connection is None if it is currently being reset. In that case, try different connection
-                if connection is not None:
-                    break
+            connection_idx, connection = self._select_connection()
             all_connections_unavailable = connection is None and num_retries <= 0
             if all_connections_unavailable:
                 if num_retries <= 0:
@@ -261,11 +507,119 @@ class ReplicaList:
                     return await self._get_next_connection(num_retries=num_retries - 1)
         except IndexError:
             # This can happen as a race condition while _removing_ connections
-            self._rr_counter = 0
-            connection = self._connections[self._rr_counter]
-        self._rr_counter = (self._rr_counter + 1) % len(self._connections)
+            connection_idx = 0
+            connection = self._connections[connection_idx]
+        self._rr_counter = (connection_idx + 1) % len(self._connections)
         return connection
 
+    def _select_connection(self) -> Tuple[Optional[int], Optional['GrpcConnectionPool.ConnectionStubs']]:
+        # candidates are ordered starting from the round robin counter, so that every strategy breaks ties between
+        # replicas in a round robin fashion
+        candidates = []
+        for i in range(len(self._connections)):
+            internal_rr_counter = (self._rr_counter + i) % len(self._connections)
+            connection = self._connections[internal_rr_counter]
+            # connection is None if it is currently being reset. In that case, try different connection
+            if connection is not None:
+                candidates.append((internal_rr_counter, connection))
+        if not candidates:
+            return None, None
+
+        if self._circuit_breaker_enabled:
+            healthy_candidates = [c for c in candidates if not self._is_ejected(c[1])]
+            # if every replica is ejected, keep using all of them instead of failing every request
+            if healthy_candidates:
+                candidates = healthy_candidates
+
+        if self.load_balancing == LoadBalancingType.LEAST_OUTSTANDING:
+            return min(candidates, key=lambda c: c[1].num_pending_requests)
+        elif self.load_balancing == LoadBalancingType.LATENCY_AWARE:
+            # power of two choices: compare two random replicas instead of scanning all of them, which avoids
+            # herding all the traffic onto the single best replica
+            if len(candidates) > 2:
+                candidates = sorted(random.sample(candidates, 2))
+            return min(candidates, key=lambda c: c[1].latency_score)
+        return candidates[0]
+
+    @property
+    def _circuit_breaker_enabled(self) -> bool:
+        return (
+            self._circuit_breaker_failures is not None
+            or self._circuit_breaker_error_rate is not None
+        )
+
+    def _is_ejected(self, connection: 'GrpcConnectionPool.ConnectionStubs') -> bool:
+        if connection.ejected:
+            return True
+        if (
+            self._circuit_breaker_failures is not None
+            and connection.consecutive_failures >= self._circuit_breaker_failures
+        ) or (
+            self._circuit_breaker_error_rate is not None
+            and connection.error_rate is not None
+            and connection.error_rate >= self._circuit_breaker_error_rate
+        ):
+            self._eject(connection)
+            return True
+        return False
+
+    def _eject(self, connection: 'GrpcConnectionPool.ConnectionStubs'):
+        self._logger.warning(
+            f'ejecting replica {connection.address} of {connection.deployment_name} after '
+            f'{connection.consecutive_failures} consecutive failures, error rate {connection.error_rate}'
+        )
+        connection.set_ejected(True)
+        task = asyncio.create_task(self._probe_ejected_connection(connection))
+        self._probing_tasks.add(task)
+        task.add_done_callback(self._probing_tasks.discard)
+
+    async def _probe_ejected_connection(
+        self, connection: 'GrpcConnectionPool.ConnectionStubs'
+    ):
+        # the connection is probed until it is serving again or until it is removed or reset
+        try:
+            while connection in self._connections:
+                await asyncio.sleep(self._circuit_breaker_probe_interval)
+                try:
+                    response = await GrpcConnectionPool.send_health_check_async(
+                        connection.address,
+                        timeout=self._circuit_breaker_probe_interval,
+                        tls=connection.tls,
+                    )
+                except grpc.RpcError as e:
+                    self._logger.debug(
+                        f'health check of ejected replica {connection.address} failed with code {e.code()}'
+                    )
+                    continue
+                if response.status == health_pb2.HealthCheckResponse.SERVING:
+                    self._logger.info(
+                        f'replica {connection.address} of {connection.deployment_name} is serving again'
+                    )
+                    break
+        finally:
+            connection.set_ejected(False)
+
+    def record_latency(self, latency: float):
+        """
+        Records the response latency of a request sent to one of the replicas
+
+        :param latency: the latency in seconds
+        """
+        self._latencies.append(latency)
+
+    def get_latency_percentile(self, percentile: float) -> Optional[float]:
+        """
+        Computes a percentile of the recent response latencies of the replicas
+
+        :param percentile: the percentile to compute, between 0 and 100
+        :returns: the latency in seconds or None if not enough latencies were recorded yet
+        """
+        if len(self._latencies) < MIN_LATENCY_SAMPLES_FOR_HEDGING:
+            return None
+        latencies = sorted(self._latencies)
+        idx = min(int(len(latencies) * percentile / 100), len(latencies) - 1)
+        return latencies[idx]
+
     def get_all_connections(self):
         """
         Returns all available connections
@@ -279,19 +633,33 @@ class ReplicaList:
         :param address: The address to check
         :returns: True if a connection for the ip exists in the list
         """
-        return address in self._address_to_connection_idx
+        return (
+            address in self._address_to_connection_idx
+            or address in self._warming_connections
+        )
 
     def has_connections(self) -> bool:
         """
         Checks if this contains any connection
         :returns: True if any connection is managed, False otherwise
         """
-        return len(self._address_to_connection_idx) > 0
+        return (
+            len(self._address_to_connection_idx) > 0
+            or len(self._warming_connections) > 0
+        )
 
     async def close(self):
         """
         Close all connections and clean up internal state
         """
+        for task in list(self._probing_tasks):
+            task.cancel()
+        for task in self._warmup_tasks.values():
+            task.cancel()
+        self._warmup_tasks.clear()
+        for _, channel in self._warming_connections.values():
+            await channel.close(0.5)
+        self._warming_connections.clear()
         for address in self._address_to_channel:
             await self._address_to_channel[address].close(0.5)
         self._address_to_channel.clear()
@@ -300,12 +668,113 @@ class ReplicaList:
         self._rr_counter = 0
 
 
+class _DataRequestStream:
+    """
+    A long-lived bidirectional stream to a runtime exposing `JinaDataRequestStreamRPC`, multiplexing the DataRequests
+    sent to it. Responses are matched to their requests by request_id, so a request does not wait for the ones sent
+    before it. When the stream breaks, all its pending requests fail with the error of the stream and a new stream
+    has to be opened
+
+    :param stub: the `JinaDataRequestStreamRPC` stub of the connection
+    :param compression: the compression used for the stream
+    """
+
+    def __init__(self, stub, compression):
+        self.closed = False
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._outgoing = asyncio.Queue()
+        self._call = stub.process_data_stream(self._requests(), compression=compression)
+        self._receiving = asyncio.create_task(self._receive())
+
+    async def _requests(self):
+        while True:
+            yield await self._outgoing.get()
+
+    async def _receive(self):
+        error = None
+        try:
+            async for response in self._call:
+                future = self._pending.pop(
+                    response.proto_wo_data.header.request_id, None
+                )
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except AioRpcError as err:
+            error = err
+        finally:
+            self.closed = True
+            if error is None:
+                error = AioRpcError(
+                    grpc.StatusCode.UNAVAILABLE,
+                    grpc.aio.Metadata(),
+                    grpc.aio.Metadata(),
+                    details='The data stream was closed',
+                )
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._pending.clear()
+
+    def is_pending(self, request: DataRequest) -> bool:
+        """
+        :param request: the request to check
+        :return: True if a request with the same request_id is waiting for its response on this stream
+        """
+        return request.proto_wo_data.header.request_id in self._pending
+
+    async def send(
+        self, request: DataRequest, timeout: Optional[float] = None
+    ) -> Tuple[DataRequest, grpc.aio.Metadata]:
+        """
+        Send a request on the stream and wait for its response
+
+        :param request: the request to send
+        :param timeout: defines timeout for the response
+        :return: Tuple of response and metadata about the response
+        """
+        request_id = request.proto_wo_data.header.request_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self._outgoing.put_nowait(request)
+        try:
+            response = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise AioRpcError(
+                grpc.StatusCode.DEADLINE_EXCEEDED,
+                grpc.aio.Metadata(),
+                grpc.aio.Metadata(),
+                details='Deadline Exceeded',
+            )
+        finally:
+            self._pending.pop(request_id, None)
+        error, metadata = _get_data_stream_status(response)
+        if error is not None:
+            raise error
+        return response, metadata
+
+
 class GrpcConnectionPool:
     """
     Manages a list of grpc connections.
 
     :param logger: the logger to use
     :param compression: The compression algorithm to be used by this GRPCConnectionPool when sending data to GRPC
+    :param load_balancing: Optional mapping from deployment name to the :class:`LoadBalancingType` used to select one
+        of its replicas. Deployments not listed use round robin
+    :param hedging_percentile: If set, a request that got no response after this percentile of the recent response
+        latencies is sent to a second replica. The first response is used and the other call is cancelled
+    :param hedging_budget: The maximum fraction of the requests that can be hedged
+    :param retry_budget: If set, the maximum fraction of the requests sent through this pool that can be retried.
+        Retries beyond this budget are not sent and the request fails immediately
+    :param circuit_breaker_failures: If set, a replica is ejected from the load balancing after this many consecutive
+        connection failures or timeouts, until a health check shows that it is serving again
+    :param circuit_breaker_error_rate: If set, a replica is ejected from the load balancing when the fraction of
+        connection failures or timeouts among its recent calls reaches this value
+    :param circuit_breaker_probe_interval: The interval in seconds between two health checks of an ejected replica
+    :param multiplex_requests: If True, single DataRequests are sent through one long-lived bidirectional stream per
+        connection instead of one unary call per request, if the target exposes `JinaDataRequestStreamRPC`
+    :param prewarm_connections: If True, new connections are established and their stubs are resolved in the
+        background, and a replica only receives requests once its channel is READY
     """
 
     K8S_PORT_USES_AFTER = 8082
@@ -321,6 +790,7 @@ class GrpcConnectionPool:
         STUB_MAPPING = {
             'jina.JinaDataRequestRPC': jina_pb2_grpc.JinaDataRequestRPCStub,
             'jina.JinaSingleDataRequestRPC': jina_pb2_grpc.JinaSingleDataRequestRPCStub,
+            'jina.JinaDataRequestStreamRPC': jina_pb2_grpc.JinaDataRequestStreamRPCStub,
             'jina.JinaDiscoverEndpointsRPC': jina_pb2_grpc.JinaDiscoverEndpointsRPCStub,
             'jina.JinaRPC': jina_pb2_grpc.JinaRPCStub,
             'jina.JinaInfoRPC': jina_pb2_grpc.JinaInfoRPCStub,
@@ -333,13 +803,31 @@ class GrpcConnectionPool:
             deployment_name: str,
             metrics: _NetworkingMetrics,
             histograms: _NetworkingHistograms,
+            runtime_name: str = '',
+            tls: bool = False,
+            multiplex_requests: bool = False,
         ):
             self.address = address
             self.channel = channel
+            self.tls = tls
+            self._multiplex_requests = multiplex_requests
+            self._data_stream: Optional[_DataRequestStream] = None
             self.deployment_name = deployment_name
             self._metrics = metrics
             self._histograms = histograms
             self._initialized = False
+            # number of requests sent through this connection that did not get a response yet
+            self.num_pending_requests = 0
+            # exponentially weighted moving average of the response latency in seconds, None until the first response
+            self.latency_ewma = None
+            # outcomes of the recent calls, used by the circuit breaker of the ReplicaList
+            self.consecutive_failures = 0
+            self._outcomes = deque(maxlen=ERROR_RATE_WINDOW_SIZE)
+            self.ejected = False
+            # bytes of the requests and responses serialized for the calls through this connection
+            self.bytes_counter = _ConnectionBytesCounter(
+                metrics, histograms, runtime_name, deployment_name, address
+            )
 
             if self._histograms:
                 self.stub_specific_labels = {
@@ -347,6 +835,24 @@ class GrpcConnectionPool:
                     'address': address,
                 }
 
+            if self._metrics.pending_requests_metrics:
+                self._pending_requests_metrics = (
+                    self._metrics.pending_requests_metrics.labels(
+                        runtime_name, deployment_name, address
+                    )
+                )
+            else:
+                self._pending_requests_metrics = None
+
+            if self._metrics.ejected_replicas_metrics:
+                self._ejected_replicas_metrics = (
+                    self._metrics.ejected_replicas_metrics.labels(
+                        runtime_name, deployment_name, address
+                    )
+                )
+            else:
+                self._ejected_replicas_metrics = None
+
         # This has to be done lazily, because the target endpoint may not be available
         # when a connection is added
         async def _init_stubs(self):
@@ -358,6 +864,7 @@ class GrpcConnectionPool:
                 stubs[service] = self.STUB_MAPPING[service](self.channel)
             self.data_list_stub = stubs['jina.JinaDataRequestRPC']
             self.single_data_stub = stubs['jina.JinaSingleDataRequestRPC']
+            self.data_stream_stub = stubs['jina.JinaDataRequestStreamRPC']
             self.stream_stub = stubs['jina.JinaRPC']
             self.endpoints_discovery_stub = stubs['jina.JinaDiscoverEndpointsRPC']
             self._initialized = True
@@ -401,16 +908,87 @@ class GrpcConnectionPool:
                 labels,
             )
 
-        def _record_request_bytes_metric(self, nbytes: int):
+        # computing the size of a request serializes it, so it is only done if the size is exported
+        def _record_request_bytes_metric(self, request: Request):
+            if not (
+                self._metrics.send_requests_bytes_metrics
+                or self._histograms.send_requests_bytes_metrics
+            ):
+                return
+            nbytes = request.nbytes
             if self._metrics.send_requests_bytes_metrics:
                 self._metrics.send_requests_bytes_metrics.observe(nbytes)
             self._histograms.record_send_requests_bytes_metrics(nbytes, self.stub_specific_labels)
 
-        def _record_received_bytes_metric(self, nbytes: int):
+        def _record_received_bytes_metric(self, response: Request):
+            if not (
+                self._metrics.received_response_bytes
+                or self._histograms.received_response_bytes
+            ):
+                return
+            nbytes = response.nbytes
             if self._metrics.received_response_bytes:
                 self._metrics.received_response_bytes.observe(nbytes)
             self._histograms.record_received_response_bytes(nbytes, self.stub_specific_labels)
 
+        @property
+        def latency_score(self) -> float:
+            """
+            Expected latency of a new request sent through this connection, the lower the better.
+            Connections that did not respond yet score 0 so that they are tried out first
+
+            :return: the moving average of the latency weighted by the number of pending requests
+            """
+            if self.latency_ewma is None:
+                return 0.0
+            return self.latency_ewma * (self.num_pending_requests + 1)
+
+        def _update_latency_ewma(self, latency: float):
+            if self.latency_ewma is None:
+                self.latency_ewma = latency
+            else:
+                self.latency_ewma += LATENCY_EWMA_ALPHA * (latency - self.latency_ewma)
+
+        def _update_pending_requests(self, value: int):
+            self.num_pending_requests += value
+            if self._pending_requests_metrics:
+                self._pending_requests_metrics.inc(value)
+            self._histograms.record_pending_requests_metrics(value, self.stub_specific_labels)
+
+        @property
+        def error_rate(self) -> Optional[float]:
+            """
+            Fraction of failed calls among the recent calls sent through this connection
+
+            :return: the error rate or None if not enough calls were sent yet
+            """
+            if len(self._outcomes) < ERROR_RATE_WINDOW_SIZE:
+                return None
+            return self._outcomes.count(False) / len(self._outcomes)
+
+        def _record_outcome(self, success: bool):
+            self._outcomes.append(success)
+            self.consecutive_failures = 0 if success else self.consecutive_failures + 1
+
+        def set_ejected(self, ejected: bool):
+            """
+            Marks this connection as ejected from or let back into the load balancing.
+            Letting a connection back in forgets the outcomes of its previous calls
+
+            :param ejected: True if the connection is ejected
+            """
+            if ejected == self.ejected:
+                return
+            self.ejected = ejected
+            if not ejected:
+                self.consecutive_failures = 0
+                self._outcomes.clear()
+            if self._ejected_replicas_metrics:
+                self._ejected_replicas_metrics.set(int(ejected))
+            self._histograms.record_ejected_replicas_metrics(
+                1 if ejected else -1, self.stub_specific_labels
+            )
+
         async def send_requests(
             self,
             requests: List[Request],
@@ -421,6 +999,9 @@ class GrpcConnectionPool:
             """
             Send requests and uses the appropriate grpc stub for this
             Stub is chosen based on availability and type of requests
+            The request is counted as pending on this connection until the call completes, the latency of successful
+            calls is tracked by :attr:`latency_ewma`. Connection failures and timeouts are recorded for the circuit
+            breaker
 
             :param requests: the requests to send
             :param metadata: the metadata to send alongside the requests
@@ -429,6 +1010,44 @@ class GrpcConnectionPool:
 
             :returns: Tuple of response and metadata about the response
             """
+            self._update_pending_requests(1)
+            start = time.perf_counter()
+            # the serializer counts the bytes into the counter of the connection set in the context of the call
+            token = connection_bytes_counter.set(self.bytes_counter)
+            try:
+                result = await self._send_requests(
+                    requests, metadata, compression, timeout
+                )
+                self._update_latency_ewma(time.perf_counter() - start)
+                self._record_outcome(True)
+                return result
+            except AioRpcError as e:
+                if e.code() in CIRCUIT_BREAKER_FAILURE_CODES:
+                    self._record_outcome(False)
+                raise
+            finally:
+                connection_bytes_counter.reset(token)
+                self._update_pending_requests(-1)
+
+        def _can_multiplex(self, request: DataRequest, metadata) -> bool:
+            # the stream carries no per request metadata, the endpoint is read from the header of the request instead
+            return (
+                self._multiplex_requests
+                and self.data_stream_stub is not None
+                and all(key == 'endpoint' for key, _ in metadata or ())
+                and not (
+                    self._data_stream is not None
+                    and self._data_stream.is_pending(request)
+                )
+            )
+
+        async def _send_requests(
+            self,
+            requests: List[Request],
+            metadata,
+            compression,
+            timeout: Optional[float] = None,
+        ) -> Tuple:
             if not self._initialized:
                 await self._init_stubs()
             request_type = type(requests[0])
@@ -436,8 +1055,21 @@ class GrpcConnectionPool:
             timer = self._get_metric_timer()
             if request_type == DataRequest and len(requests) == 1:
                 request = requests[0]
-                if self.single_data_stub:
-                    self._record_request_bytes_metric(request.nbytes)
+                if self._can_multiplex(request, metadata):
+                    if self._data_stream is None or self._data_stream.closed:
+                        self._data_stream = _DataRequestStream(
+                            self.data_stream_stub, compression
+                        )
+                    self._record_request_bytes_metric(request)
+                    with timer:
+                        response, metadata = await self._data_stream.send(
+                            request, timeout
+                        )
+                        self._record_received_bytes_metric(response)
+                    return response, metadata
+
+                elif self.single_data_stub:
+                    self._record_request_bytes_metric(request)
                     call_result = self.single_data_stub.process_single_data(
                         request,
                         metadata=metadata,
@@ -449,11 +1081,11 @@ class GrpcConnectionPool:
                             await call_result.trailing_metadata(),
                             await call_result,
                         )
-                        self._record_received_bytes_metric(response.nbytes)
+                        self._record_received_bytes_metric(response)
                     return response, metadata
 
                 elif self.stream_stub:
-                    self._record_request_bytes_metric(request.nbytes)
+                    self._record_request_bytes_metric(request)
 
                     with timer:
                         async for response in self.stream_stub.Call(
@@ -462,13 +1094,13 @@ class GrpcConnectionPool:
                             timeout=timeout,
                             metadata=metadata,
                         ):
-                            self._record_received_bytes_metric(response.nbytes)
+                            self._record_received_bytes_metric(response)
                             return response, None
 
             if request_type == DataRequest and len(requests) > 1:
                 if self.data_list_stub:
                     for request in requests:
-                        self._record_request_bytes_metric(request.nbytes)
+                        self._record_request_bytes_metric(request)
                     call_result = self.data_list_stub.process_data(
                         requests,
                         metadata=metadata,
@@ -480,7 +1112,7 @@ class GrpcConnectionPool:
                             await call_result.trailing_metadata(),
                             await call_result,
                         )
-                        self._record_received_bytes_metric(response.nbytes)
+                        self._record_received_bytes_metric(response)
                     return response, metadata
                 else:
                     raise ValueError(
@@ -502,6 +1134,12 @@ class GrpcConnectionPool:
             tracing_client_interceptor: Optional[
                 'OpenTelemetryClientInterceptor'
             ] = None,
+            load_balancing: Optional[Dict[str, LoadBalancingType]] = None,
+            circuit_breaker_failures: Optional[int] = None,
+            circuit_breaker_error_rate: Optional[float] = None,
+            circuit_breaker_probe_interval: float = 1.0,
+            multiplex_requests: bool = False,
+            prewarm_connections: bool = False,
         ):
             self._logger = logger
             # this maps deployments to shards or heads
@@ -516,6 +1154,12 @@ class GrpcConnectionPool:
                 os.unsetenv('https_proxy')
             self.aio_tracing_client_interceptors = aio_tracing_client_interceptors
             self.tracing_client_interceptor = tracing_client_interceptor
+            self._load_balancing = load_balancing or {}
+            self._circuit_breaker_failures = circuit_breaker_failures
+            self._circuit_breaker_error_rate = circuit_breaker_error_rate
+            self._circuit_breaker_probe_interval = circuit_breaker_probe_interval
+            self._multiplex_requests = multiplex_requests
+            self._prewarm_connections = prewarm_connections
 
         def add_replica(self, deployment: str, shard_id: int, address: str):
             self._add_connection(deployment, shard_id, address, 'shards')
@@ -622,6 +1266,14 @@ class GrpcConnectionPool:
                     self.runtime_name,
                     self.aio_tracing_client_interceptors,
                     self.tracing_client_interceptor,
+                    load_balancing=self._load_balancing.get(
+                        deployment, LoadBalancingType.ROUND_ROBIN
+                    ),
+                    circuit_breaker_failures=self._circuit_breaker_failures,
+                    circuit_breaker_error_rate=self._circuit_breaker_error_rate,
+                    circuit_breaker_probe_interval=self._circuit_breaker_probe_interval,
+                    multiplex_requests=self._multiplex_requests,
+                    prewarm_connections=self._prewarm_connections,
                 )
                 self._deployments[deployment][type][entity_id] = connection_list
 
@@ -672,8 +1324,25 @@ class GrpcConnectionPool:
         meter: Optional['Meter'] = None,
         aio_tracing_client_interceptors: Optional[Sequence['ClientInterceptor']] = None,
         tracing_client_interceptor: Optional['OpenTelemetryClientInterceptor'] = None,
+        load_balancing: Optional[Dict[str, Union[str, LoadBalancingType]]] = None,
+        hedging_percentile: Optional[float] = None,
+        hedging_budget: float = 0.1,
+        circuit_breaker_failures: Optional[int] = None,
+        circuit_breaker_error_rate: Optional[float] = None,
+        circuit_breaker_probe_interval: float = 1.0,
+        retry_budget: Optional[float] = None,
+        multiplex_requests: bool = False,
+        prewarm_connections: bool = False,
     ):
         self._logger = logger or JinaLogger(self.__class__.__name__)
+        self._hedging_percentile = hedging_percentile
+        self._hedging_budget = _RequestBudget(hedging_budget)
+        # the retry budget starts full so that the first requests can be retried as well
+        self._retry_budget = (
+            _RequestBudget(retry_budget, initial_tokens=_RequestBudget.DEFAULT_MAX_TOKENS)
+            if retry_budget is not None
+            else None
+        )
 
         self.compression = (
             getattr(grpc.Compression, compression)
@@ -686,7 +1355,7 @@ class GrpcConnectionPool:
                 required=True,
                 help_text='You need to install the `prometheus_client` to use the montitoring functionality of jina',
             ):
-                from prometheus_client import Summary
+                from prometheus_client import Counter, Gauge, Summary
 
             sending_requests_time_metrics = Summary(
                 'sending_request_seconds',
@@ -711,15 +1380,85 @@ class GrpcConnectionPool:
                 namespace='jina',
                 labelnames=('runtime_name',),
             ).labels(runtime_name)
+
+            pending_requests_metrics = Gauge(
+                'number_of_pending_requests_per_replica',
+                'Number of requests sent to a replica of the Head/Executor that did not get a response yet',
+                registry=metrics_registry,
+                namespace='jina',
+                labelnames=('runtime_name', 'deployment', 'address'),
+            )
+
+            hedged_requests_metrics = Counter(
+                'hedged_requests',
+                'Number of requests sent to a second replica of the Head/Executor because the first one was slow',
+                registry=metrics_registry,
+                namespace='jina',
+                labelnames=('runtime_name',),
+            ).labels(runtime_name)
+
+            won_hedged_requests_metrics = Counter(
+                'won_hedged_requests',
+                'Number of hedged requests whose response arrived before the response of the first replica',
+                registry=metrics_registry,
+                namespace='jina',
+                labelnames=('runtime_name',),
+            ).labels(runtime_name)
+
+            ejected_replicas_metrics = Gauge(
+                'ejected_replicas',
+                'Whether a replica of the Head/Executor is ejected from the load balancing by the circuit breaker',
+                registry=metrics_registry,
+                namespace='jina',
+                labelnames=('runtime_name', 'deployment', 'address'),
+            )
+
+            retry_budget_exhausted_metrics = Counter(
+                'retry_budget_exhausted',
+                'Number of retries to the Head/Executor that were not sent because the retry budget was exhausted',
+                registry=metrics_registry,
+                namespace='jina',
+                labelnames=('runtime_name',),
+            ).labels(runtime_name)
+
+            sent_bytes_metrics = Counter(
+                'sent_bytes',
+                'Number of bytes of the requests sent to a replica of the Head/Executor',
+                registry=metrics_registry,
+                namespace='jina',
+                labelnames=('runtime_name', 'deployment', 'address'),
+            )
+
+            received_bytes_metrics = Counter(
+                'received_bytes',
+                'Number of bytes of the responses received from a replica of the Head/Executor',
+                registry=metrics_registry,
+                namespace='jina',
+                labelnames=('runtime_name', 'deployment', 'address'),
+            )
         else:
             sending_requests_time_metrics = None
             received_response_bytes = None
             send_requests_bytes_metrics = None
+            pending_requests_metrics = None
+            hedged_requests_metrics = None
+            won_hedged_requests_metrics = None
+            ejected_replicas_metrics = None
+            retry_budget_exhausted_metrics = None
+            sent_bytes_metrics = None
+            received_bytes_metrics = None
 
         self._metrics = _NetworkingMetrics(
             sending_requests_time_metrics,
             received_response_bytes,
             send_requests_bytes_metrics,
+            pending_requests_metrics,
+            hedged_requests_metrics,
+            won_hedged_requests_metrics,
+            ejected_replicas_metrics,
+            retry_budget_exhausted_metrics,
+            sent_bytes_metrics,
+            received_bytes_metrics,
         )
 
         if meter:
@@ -739,6 +1478,36 @@ class GrpcConnectionPool:
                     unit='By',
                     description='Size in bytes of the request sent to the Head/Executor',
                 ),
+                pending_requests_metrics=meter.create_up_down_counter(
+                    name='jina_number_of_pending_requests_per_replica',
+                    description='Number of requests sent to a replica of the Head/Executor that did not get a response yet',
+                ),
+                hedged_requests_metrics=meter.create_counter(
+                    name='jina_hedged_requests',
+                    description='Number of requests sent to a second replica of the Head/Executor because the first one was slow',
+                ),
+                won_hedged_requests_metrics=meter.create_counter(
+                    name='jina_won_hedged_requests',
+                    description='Number of hedged requests whose response arrived before the response of the first replica',
+                ),
+                ejected_replicas_metrics=meter.create_up_down_counter(
+                    name='jina_ejected_replicas',
+                    description='Number of replicas of the Head/Executor ejected from the load balancing by the circuit breaker',
+                ),
+                retry_budget_exhausted_metrics=meter.create_counter(
+                    name='jina_retry_budget_exhausted',
+                    description='Number of retries to the Head/Executor that were not sent because the retry budget was exhausted',
+                ),
+                sent_bytes_metrics=meter.create_counter(
+                    name='jina_sent_bytes',
+                    unit='By',
+                    description='Number of bytes of the requests sent to a replica of the Head/Executor',
+                ),
+                received_bytes_metrics=meter.create_counter(
+                    name='jina_received_bytes',
+                    unit='By',
+                    description='Number of bytes of the responses received from a replica of the Head/Executor',
+                ),
                 histogram_metric_labels={'runtime_name': runtime_name},
             )
         else:
@@ -753,6 +1522,17 @@ class GrpcConnectionPool:
             self._histograms,
             self.aio_tracing_client_interceptors,
             self.tracing_client_interceptor,
+            {
+                deployment: LoadBalancingType.from_string(strategy)
+                if isinstance(strategy, str)
+                else strategy
+                for deployment, strategy in (load_balancing or {}).items()
+            },
+            circuit_breaker_failures,
+            circuit_breaker_error_rate,
+            circuit_breaker_probe_interval,
+            multiplex_requests,
+            prewarm_connections,
         )
         self._deployment_address_map = {}
 
@@ -967,6 +1747,23 @@ class GrpcConnectionPool:
             if connection_list:
                 await connection_list.reset_connection(current_address, current_deployment)
 
+            return InternalNetworkError(
+                og_exception=error,
+                request_id=request_id,
+                dest_addr=tried_addresses,
+                details=error.details(),
+            )
+        elif self._retry_budget and not self._retry_budget.withdraw():
+            self._logger.debug(
+                f'GRPC call failed with code {error.code()}, retry budget exhausted'
+            )
+            if self._metrics.retry_budget_exhausted_metrics:
+                self._metrics.retry_budget_exhausted_metrics.inc()
+            self._histograms.record_retry_budget_exhausted_metrics(
+                1, {'deployment': current_deployment}
+            )
+            from jina.excepts import InternalNetworkError
+
             return InternalNetworkError(
                 og_exception=error,
                 request_id=request_id,
@@ -999,8 +1796,19 @@ class GrpcConnectionPool:
         if metadata:
             metadata = tuple(metadata.items())
 
+        async def send(connection):
+            return await connection.send_requests(
+                requests=requests,
+                metadata=metadata,
+                compression=self.compression,
+                # retries and hedged requests only get the time left until the deadline of the request
+                timeout=_get_remaining_timeout(requests[0], timeout),
+            )
+
         async def task_wrapper():
             tried_addresses = set()
+            if self._retry_budget:
+                self._retry_budget.deposit()
             if retries is None or retries < 0:
                 total_num_tries = (
                     max(DEFAULT_MINIMUM_RETRIES, len(connections.get_all_connections()))
@@ -1014,12 +1822,14 @@ class GrpcConnectionPool:
                 )
                 tried_addresses.add(current_connection.address)
                 try:
-                    return await current_connection.send_requests(
-                        requests=requests,
-                        metadata=metadata,
-                        compression=self.compression,
-                        timeout=timeout,
-                    )
+                    if self._hedging_percentile is not None and i == 0:
+                        return await self._send_hedged(
+                            send, current_connection, connections, tried_addresses
+                        )
+                    return await send(current_connection)
+                except RequestDeadlineExceeded as e:
+                    # the request is dropped without trying the other replicas
+                    return e
                 except AioRpcError as e:
                     error = await self._handle_aiorpcerror(
                         error=e,
@@ -1038,6 +1848,65 @@ class GrpcConnectionPool:
 
         return asyncio.create_task(task_wrapper())
 
+    async def _send_hedged(
+        self,
+        send,
+        connection: ConnectionStubs,
+        connections: ReplicaList,
+        tried_addresses: Set[str],
+    ):
+        # sends to `connection` and, if no response arrived after the hedging delay, to a second replica as well
+        self._hedging_budget.deposit()
+        start = time.perf_counter()
+        delay = connections.get_latency_percentile(self._hedging_percentile)
+        primary = asyncio.create_task(send(connection))
+        try:
+            if delay is not None and len(connections.get_all_connections()) > 1:
+                done, _ = await asyncio.wait({primary}, timeout=delay)
+                if not done and self._hedging_budget.withdraw():
+                    hedge_connection = await connections.get_next_connection()
+                    if hedge_connection is not connection:
+                        tried_addresses.add(hedge_connection.address)
+                        result = await self._wait_first_response(
+                            primary, asyncio.create_task(send(hedge_connection)), connection
+                        )
+                        connections.record_latency(time.perf_counter() - start)
+                        return result
+            result = await primary
+            connections.record_latency(time.perf_counter() - start)
+            return result
+        finally:
+            if not primary.done():
+                primary.cancel()
+
+    async def _wait_first_response(
+        self, primary: asyncio.Task, hedge: asyncio.Task, connection: ConnectionStubs
+    ):
+        labels = {'deployment': connection.deployment_name}
+        if self._metrics.hedged_requests_metrics:
+            self._metrics.hedged_requests_metrics.inc()
+        self._histograms.record_hedged_requests_metrics(1, labels)
+
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # a failed call only counts if the other one failed as well
+                for task in sorted(done, key=lambda t: t.exception() is not None):
+                    if task.exception() is None or not pending:
+                        if task is hedge and task.exception() is None:
+                            if self._metrics.won_hedged_requests_metrics:
+                                self._metrics.won_hedged_requests_metrics.inc()
+                            self._histograms.record_won_hedged_requests_metrics(
+                                1, labels
+                            )
+                        return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
     def _send_discover_endpoint(
         self,
         connection_list: ReplicaList,
@@ -1049,6 +1918,8 @@ class GrpcConnectionPool:
         async def task_wrapper():
 
             tried_addresses = set()
+            if self._retry_budget:
+                self._retry_budget.deposit()
             if retries is None or retries < 0:
                 total_num_tries = (
                     max(
@@ -1242,6 +2113,35 @@ class GrpcConnectionPool:
                 if e.code() != grpc.StatusCode.UNAVAILABLE or i == 2:
                     raise
 
+    @staticmethod
+    async def send_health_check_async(
+        target: str,
+        timeout: float = 1.0,
+        tls: bool = False,
+        root_certificates: Optional[str] = None,
+    ) -> health_pb2.HealthCheckResponse:
+        """
+        Sends a health check asynchronously to the target via grpc
+
+        :param target: where to send the health check to, like 127.0.0.1:8080
+        :param timeout: timeout for the send
+        :param tls: if True, use tls encryption for the grpc channel
+        :param root_certificates: the path to the root certificates for tls, only used if tls is True
+
+        :returns: the response health check
+        """
+
+        async with GrpcConnectionPool.get_grpc_channel(
+            target,
+            asyncio=True,
+            tls=tls,
+            root_certificates=root_certificates,
+        ) as channel:
+            health_check_req = health_pb2.HealthCheckRequest()
+            health_check_req.service = ''
+            stub = health_pb2_grpc.HealthStub(channel)
+            return await stub.Check(health_check_req, timeout=timeout)
+
     @staticmethod
     def send_requests_sync(
         requests: List[Request],
@@ -1347,6 +2247,9 @@ class GrpcConnectionPool:
         tls=False,
         root_certificates: Optional[str] = None,
         aio_tracing_client_interceptors: Optional[Sequence['ClientInterceptor']] = None,
+        runtime_name: str = '',
+        multiplex_requests: bool = False,
+        options: Optional[list] = None,
     ) -> Tuple[ConnectionStubs, grpc.aio.Channel]:
         """
         Creates an async GRPC Channel. This channel has to be closed eventually!
@@ -1358,10 +2261,14 @@ class GrpcConnectionPool:
         :param metrics: NetworkingMetrics object that contain optional metrics
         :param histograms: NetworkingHistograms object that optionally record metrics
         :param aio_tracing_client_interceptors: List of async io gprc client tracing interceptors for tracing requests for asycnio channel
+        :param runtime_name: name of the runtime owning the channel, used to label the metrics of the stubs
+        :param multiplex_requests: if True, the stubs send single DataRequests through a long-lived stream
+        :param options: the options of the grpc channel, the default options are used if not set
         :returns: DataRequest stubs and an async grpc channel
         """
         channel = GrpcConnectionPool.get_grpc_channel(
             address,
+            options=options,
             asyncio=True,
             tls=tls,
             root_certificates=root_certificates,
@@ -1369,7 +2276,16 @@ class GrpcConnectionPool:
         )
 
         return (
-            GrpcConnectionPool.ConnectionStubs(address, channel, deployment_name, metrics, histograms),
+            GrpcConnectionPool.ConnectionStubs(
+                address,
+                channel,
+                deployment_name,
+                metrics,
+                histograms,
+                runtime_name,
+                tls,
+                multiplex_requests,
+            ),
             channel,
         )
 
@@ -8,9 +8,9 @@ from typing import Dict, List, Optional, Tuple
 import grpc.aio
 
 from jina import __default_endpoint__
-from jina.excepts import InternalNetworkError
+from jina.excepts import InternalNetworkError, RequestDeadlineExceeded
 from jina.serve.networking import GrpcConnectionPool
-from jina.serve.runtimes.helper import _parse_specific_params
+from jina.serve.runtimes.helper import _get_remaining_timeout, _parse_specific_params
 from jina.serve.runtimes.worker.request_handling import WorkerRequestHandler
 from jina.types.request.data import DataRequest
 
@@ -81,7 +81,9 @@ class TopologyGraph:
 
         def _handle_internalnetworkerror(self, err):
             err_code = err.code()
-            if err_code == grpc.StatusCode.UNAVAILABLE:
+            if isinstance(err, RequestDeadlineExceeded):
+                raise err
+            elif err_code == grpc.StatusCode.UNAVAILABLE:
                 err._details = (
                     err.details()
                     + f' |Gateway: Communication error with deployment {self.name} at address(es) {err.dest_addr}. '
@@ -155,6 +157,11 @@ class TopologyGraph:
                         target_executor_pattern, self.name
                     ):
                         return request, metadata
+                    # do not send requests the client already gave up on, and do not wait for a response longer
+                    # than the client does
+                    timeout = _get_remaining_timeout(
+                        self.parts_to_send[0], self._timeout_send
+                    )
                     # otherwise, send to executor and get response
                     try:
                         result = await connection_pool.send_requests_once(
@@ -163,7 +170,7 @@ class TopologyGraph:
                             metadata=self._metadata,
                             head=True,
                             endpoint=endpoint,
-                            timeout=self._timeout_send,
+                            timeout=timeout,
                             retries=self._retries,
                         )
                         if issubclass(type(result), BaseException):
@@ -3,20 +3,20 @@ import json
 import os
 from abc import ABC
 from collections import defaultdict
-from typing import List
+from typing import AsyncIterator, List
 
 import grpc
 from grpc_health.v1 import health, health_pb2, health_pb2_grpc
 from grpc_reflection.v1alpha import reflection
 
 from jina.enums import PollingType
-from jina.excepts import InternalNetworkError
+from jina.excepts import InternalNetworkError, RequestDeadlineExceeded
 from jina.helper import get_full_version
 from jina.proto import jina_pb2, jina_pb2_grpc
 from jina.serve.networking import GrpcConnectionPool
 from jina.serve.runtimes.asyncio import AsyncNewLoopRuntime
 from jina.serve.runtimes.head.request_handling import HeaderRequestHandler
-from jina.serve.runtimes.helper import _get_grpc_server_options
+from jina.serve.runtimes.helper import _get_grpc_server_options, _process_data_stream
 from jina.types.request.data import DataRequest, Response
 
 
@@ -51,6 +51,15 @@ class HeadRuntime(AsyncNewLoopRuntime, ABC):
             meter=self.meter,
             aio_tracing_client_interceptors=self.aio_tracing_client_interceptors(),
             tracing_client_interceptor=self.tracing_client_interceptor(),
+            load_balancing={self._deployment_name: args.load_balancing},
+            hedging_percentile=args.hedging_percentile,
+            hedging_budget=args.hedging_budget,
+            circuit_breaker_failures=args.circuit_breaker_failures,
+            circuit_breaker_error_rate=args.circuit_breaker_error_rate,
+            circuit_breaker_probe_interval=args.circuit_breaker_probe_interval,
+            retry_budget=args.retry_budget,
+            multiplex_requests=args.multiplex_requests,
+            prewarm_connections=args.prewarm_connections,
         )
         self._retries = self.args.retries
 
@@ -137,6 +146,9 @@ class HeadRuntime(AsyncNewLoopRuntime, ABC):
             self, self._grpc_server
         )
         jina_pb2_grpc.add_JinaDataRequestRPCServicer_to_server(self, self._grpc_server)
+        jina_pb2_grpc.add_JinaDataRequestStreamRPCServicer_to_server(
+            self, self._grpc_server
+        )
         jina_pb2_grpc.add_JinaDiscoverEndpointsRPCServicer_to_server(
             self, self._grpc_server
         )
@@ -144,6 +156,7 @@ class HeadRuntime(AsyncNewLoopRuntime, ABC):
         service_names = (
             jina_pb2.DESCRIPTOR.services_by_name['JinaSingleDataRequestRPC'].full_name,
             jina_pb2.DESCRIPTOR.services_by_name['JinaDataRequestRPC'].full_name,
+            jina_pb2.DESCRIPTOR.services_by_name['JinaDataRequestStreamRPC'].full_name,
             jina_pb2.DESCRIPTOR.services_by_name['JinaDiscoverEndpointsRPC'].full_name,
             jina_pb2.DESCRIPTOR.services_by_name['JinaInfoRPC'].full_name,
             reflection.SERVICE_NAME,
@@ -190,6 +203,22 @@ class HeadRuntime(AsyncNewLoopRuntime, ABC):
         """
         return await self.process_data([request], context)
 
+    async def process_data_stream(
+        self, request_iterator, context
+    ) -> AsyncIterator[DataRequest]:
+        """
+        Process the requests received on a long-lived stream concurrently, the responses are streamed back as soon as
+        they are ready and are matched to their requests by request_id
+
+        :param request_iterator: the data requests to process
+        :param context: grpc context
+        :yield: the response requests
+        """
+        async for response in _process_data_stream(
+            self.process_single_data, request_iterator, context
+        ):
+            yield response
+
     def _handle_internalnetworkerror(self, err, context, response):
         err_code = err.code()
         if err_code == grpc.StatusCode.UNAVAILABLE:
@@ -230,6 +259,11 @@ class HeadRuntime(AsyncNewLoopRuntime, ABC):
             )
             context.set_trailing_metadata(metadata.items())
             return response
+        except RequestDeadlineExceeded as err:
+            self.logger.debug(err.details())
+            context.set_details(err.details())
+            context.set_code(err.code())
+            return Response()
         except InternalNetworkError as err:  # can't connect, Flow broken, interrupt the streaming through gRPC error mechanism
             return self._handle_internalnetworkerror(
                 err=err, context=context, response=Response()
@@ -1,6 +1,7 @@
 import asyncio
 from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
+from jina.serve.runtimes.helper import _get_remaining_timeout
 from jina.serve.runtimes.monitoring import MonitoringRequestMixin
 from jina.serve.runtimes.worker.request_handling import WorkerRequestHandler
 
@@ -102,6 +103,9 @@ class HeaderRequestHandler(MonitoringRequestMixin):
         polling_type,
         deployment_name,
     ) -> Tuple['DataRequest', Dict]:
+        # drop requests whose deadline passed before reading their docs, the timeouts of the calls to the workers
+        # are bounded by the remaining time of the request
+        _get_remaining_timeout(requests[0])
         for req in requests:
             self._update_start_request_metrics(req)
         WorkerRequestHandler.merge_routes(requests)
@@ -111,7 +115,7 @@ class HeaderRequestHandler(MonitoringRequestMixin):
             result = await connection_pool.send_requests_once(
                 requests,
                 deployment='uses_before',
-                timeout=timeout_send,
+                timeout=_get_remaining_timeout(requests[0], timeout_send),
                 retries=retries,
             )
             if issubclass(type(result), BaseException):
@@ -128,7 +132,7 @@ class HeaderRequestHandler(MonitoringRequestMixin):
         ) = await self._gather_worker_tasks(
             requests=requests,
             deployment_name=deployment_name,
-            timeout_send=timeout_send,
+            timeout_send=_get_remaining_timeout(requests[0], timeout_send),
             connection_pool=connection_pool,
             polling_type=polling_type,
             retries=retries,
@@ -151,7 +155,7 @@ class HeaderRequestHandler(MonitoringRequestMixin):
             result = await connection_pool.send_requests_once(
                 worker_results,
                 deployment='uses_after',
-                timeout=timeout_send,
+                timeout=_get_remaining_timeout(worker_results[0], timeout_send),
                 retries=retries,
             )
             if issubclass(type(result), BaseException):
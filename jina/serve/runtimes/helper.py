@@ -1,8 +1,32 @@
+import asyncio
 import copy
-from typing import Any, Dict, List, Tuple
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+import grpc
+
+from jina.excepts import RequestDeadlineExceeded
+from jina.proto import jina_pb2
+
+if TYPE_CHECKING:  # pragma: no cover
+    from jina.types.request.data import DataRequest
 
 _SPECIFIC_EXECUTOR_SEPARATOR = '__'
 
+# name of the exception stored in the header of a response streamed back on a data stream when handling the request
+# failed with a gRPC status, the status code is stored as its only argument
+_DATA_STREAM_RPC_ERROR = 'DataStreamRpcError'
+
 
 def _spit_key_and_executor_name(key_name: str) -> Tuple[str]:
     """Split a specific key into a key, name pair
@@ -109,3 +133,175 @@ def _get_grpc_server_options(option_from_args: Dict) -> List[Tuple[str, Any]]:
     )  # merge new and default args
 
     return list(option_from_args.items())
+
+
+def _get_remaining_timeout(
+    request: 'DataRequest', timeout: Optional[float] = None
+) -> Optional[float]:
+    """Get the timeout to use when forwarding a request, bounded by the deadline set in its header.
+    Only the header of the request is deserialized, so an expired request can be dropped without reading its docs
+
+    :param request: the request to forward
+    :param timeout: the timeout in seconds configured for the forwarding, None for no timeout
+    :return: the timeout in seconds, None if neither the timeout nor the deadline of the request is set
+    :raises RequestDeadlineExceeded: if the deadline of the request has passed already
+    """
+    header = request.proto_wo_data.header
+    if not header.HasField('timeout'):
+        return timeout
+    # the deadline is an epoch time, so this relies on the clocks of the hosts in a Flow being in sync
+    remaining = header.timeout - time.time()
+    if remaining <= 0:
+        raise RequestDeadlineExceeded(
+            request_id=header.request_id,
+            details=f'Request {header.request_id} dropped, its deadline passed {-remaining:.3f}s ago',
+        )
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+class _DataStreamRequestContext:
+    """Stands in for the gRPC context when handling one of the requests received on a data stream.
+    The status and trailing metadata set for the request are kept, to be sent back in the header of its response
+
+    :param context: the grpc context of the stream
+    :param endpoint: the endpoint targeted by the request, not part of the metadata of the stream as it changes
+        from one request to the next
+    """
+
+    def __init__(self, context, endpoint: str):
+        self._context = context
+        self._endpoint = endpoint
+        self.code = None
+        self.details = ''
+        self.trailing_metadata = ()
+
+    def invocation_metadata(self):
+        """
+        :return: the metadata of the stream, with the endpoint of the request
+        """
+        metadata = tuple(self._context.invocation_metadata() or ())
+        if self._endpoint:
+            metadata += (('endpoint', self._endpoint),)
+        return metadata
+
+    def set_code(self, code: grpc.StatusCode):
+        """
+        :param code: the gRPC status code of the request
+        """
+        self.code = code
+
+    def set_details(self, details: str):
+        """
+        :param details: the details of the gRPC status of the request
+        """
+        self.details = details
+
+    def set_trailing_metadata(self, trailing_metadata):
+        """
+        :param trailing_metadata: the trailing metadata of the request
+        """
+        self.trailing_metadata = tuple(trailing_metadata)
+
+
+def _set_data_stream_status(
+    response: 'DataRequest',
+    request_id: str,
+    request_context: _DataStreamRequestContext,
+):
+    """Store the outcome of handling a request received on a data stream in the header of its response.
+    A stream only has one status for all its requests, so a failed gRPC status of the request is stored as a
+    :data:`_DATA_STREAM_RPC_ERROR` exception, and the `is-error` trailing metadata as an error status
+
+    :param response: the response of the request
+    :param request_id: the id of the request, used to match the response with its request
+    :param request_context: the context in which the request was handled
+    """
+    header = response.proto_wo_data.header
+    header.request_id = request_id
+    if request_context.code not in (None, grpc.StatusCode.OK):
+        header.status.code = jina_pb2.StatusProto.ERROR
+        header.status.description = request_context.details or ''
+        header.status.exception.name = _DATA_STREAM_RPC_ERROR
+        del header.status.exception.args[:]
+        header.status.exception.args.append(request_context.code.name)
+    elif 'is-error' in dict(request_context.trailing_metadata):
+        header.status.code = jina_pb2.StatusProto.ERROR
+
+
+def _get_data_stream_status(
+    response: 'DataRequest',
+) -> Tuple[Optional[grpc.aio.AioRpcError], grpc.aio.Metadata]:
+    """Read the outcome of a request sent on a data stream from the header of its response, the counterpart of
+    :func:`_set_data_stream_status`
+
+    :param response: the response received on the stream
+    :return: the gRPC error the request failed with if any, and the trailing metadata of the request
+    """
+    status = response.proto_wo_data.header.status
+    if status.code != jina_pb2.StatusProto.ERROR:
+        return None, grpc.aio.Metadata()
+    if (
+        status.exception.name == _DATA_STREAM_RPC_ERROR
+        and status.exception.args
+        and status.exception.args[0] in grpc.StatusCode.__members__
+    ):
+        error = grpc.aio.AioRpcError(
+            grpc.StatusCode[status.exception.args[0]],
+            grpc.aio.Metadata(),
+            grpc.aio.Metadata(),
+            details=status.description,
+        )
+        return error, grpc.aio.Metadata()
+    return None, grpc.aio.Metadata(('is-error', 'true'))
+
+
+async def _process_data_stream(
+    process_single_data: Callable[..., Awaitable['DataRequest']],
+    request_iterator: AsyncIterator['DataRequest'],
+    context,
+) -> AsyncIterator['DataRequest']:
+    """Handle the requests received on a data stream concurrently and stream back every response as soon as it is
+    ready, so the responses may come back in a different order than the requests
+
+    :param process_single_data: handles a single request, like the unary `process_single_data` of a runtime
+    :param request_iterator: the requests received on the stream
+    :param context: the grpc context of the stream
+    :yield: the responses, with the outcome of each request in its header
+    """
+    handled = asyncio.Queue()
+
+    async def _handle(request: 'DataRequest') -> 'DataRequest':
+        header = request.proto_wo_data.header
+        request_id = header.request_id
+        request_context = _DataStreamRequestContext(context, header.exec_endpoint)
+        response = await process_single_data(request, request_context)
+        _set_data_stream_status(response, request_id, request_context)
+        return response
+
+    async def _receive():
+        handling = set()
+        try:
+            async for request in request_iterator:
+                task = asyncio.create_task(_handle(request))
+                handling.add(task)
+                task.add_done_callback(handling.discard)
+                task.add_done_callback(handled.put_nowait)
+            if handling:
+                await asyncio.wait(set(handling))
+        except asyncio.CancelledError:
+            for task in handling:
+                task.cancel()
+            raise
+        finally:
+            handled.put_nowait(None)
+
+    receiving = asyncio.create_task(_receive())
+    try:
+        while True:
+            task = await handled.get()
+            if task is None:
+                break
+            yield task.result()
+        await receiving
+    finally:
+        receiving.cancel()
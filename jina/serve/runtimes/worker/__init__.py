@@ -1,18 +1,18 @@
 import argparse
 from abc import ABC
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional
 
 import grpc
 from grpc_health.v1 import health, health_pb2, health_pb2_grpc
 from grpc_reflection.v1alpha import reflection
 
-from jina.excepts import RuntimeTerminated
+from jina.excepts import RequestDeadlineExceeded, RuntimeTerminated
 from jina.helper import get_full_version
 from jina.importer import ImportExtensions
 from jina.proto import jina_pb2, jina_pb2_grpc
 from jina.serve.instrumentation import MetricsTimer
 from jina.serve.runtimes.asyncio import AsyncNewLoopRuntime
-from jina.serve.runtimes.helper import _get_grpc_server_options
+from jina.serve.runtimes.helper import _get_grpc_server_options, _process_data_stream
 from jina.serve.runtimes.worker.request_handling import WorkerRequestHandler
 from jina.types.request.data import DataRequest
 
@@ -122,6 +122,9 @@ class WorkerRuntime(AsyncNewLoopRuntime, ABC):
             self, self._grpc_server
         )
         jina_pb2_grpc.add_JinaDataRequestRPCServicer_to_server(self, self._grpc_server)
+        jina_pb2_grpc.add_JinaDataRequestStreamRPCServicer_to_server(
+            self, self._grpc_server
+        )
 
         jina_pb2_grpc.add_JinaDiscoverEndpointsRPCServicer_to_server(
             self, self._grpc_server
@@ -130,6 +133,7 @@ class WorkerRuntime(AsyncNewLoopRuntime, ABC):
         service_names = (
             jina_pb2.DESCRIPTOR.services_by_name['JinaSingleDataRequestRPC'].full_name,
             jina_pb2.DESCRIPTOR.services_by_name['JinaDataRequestRPC'].full_name,
+            jina_pb2.DESCRIPTOR.services_by_name['JinaDataRequestStreamRPC'].full_name,
             jina_pb2.DESCRIPTOR.services_by_name['JinaDiscoverEndpointsRPC'].full_name,
             jina_pb2.DESCRIPTOR.services_by_name['JinaInfoRPC'].full_name,
             reflection.SERVICE_NAME,
@@ -178,6 +182,22 @@ class WorkerRuntime(AsyncNewLoopRuntime, ABC):
         """
         return await self.process_data([request], context)
 
+    async def process_data_stream(
+        self, request_iterator, context
+    ) -> AsyncIterator[DataRequest]:
+        """
+        Process the requests received on a long-lived stream concurrently, the responses are streamed back as soon as
+        they are ready and are matched to their requests by request_id
+
+        :param request_iterator: the data requests to process
+        :param context: grpc context
+        :yield: the response requests
+        """
+        async for response in _process_data_stream(
+            self.process_single_data, request_iterator, context
+        ):
+            yield response
+
     async def endpoint_discovery(self, empty, context) -> jina_pb2.EndpointsProto:
         """
         Process the the call requested and return the list of Endpoints exposed by the Executor wrapped inside this Runtime
@@ -233,6 +253,11 @@ class WorkerRuntime(AsyncNewLoopRuntime, ABC):
                         1, attributes=self._metric_attributes
                     )
                 return result
+            except RequestDeadlineExceeded as err:
+                self.logger.debug(err.details())
+                context.set_details(err.details())
+                context.set_code(err.code())
+                return requests[0]
             except (RuntimeError, Exception) as ex:
                 self.logger.error(
                     f'{ex!r}'
@@ -5,6 +5,7 @@ from jina import __default_endpoint__
 from jina.excepts import BadConfigSource
 from jina.importer import ImportExtensions
 from jina.serve.executors import BaseExecutor
+from jina.serve.runtimes.helper import _get_remaining_timeout
 from jina.types.request.data import DataRequest
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -267,6 +268,8 @@ class WorkerRequestHandler:
         :param tracing_context: Optional OpenTelemetry tracing context from the originating request.
         :returns: the processed message
         """
+        # drop the request before reading its docs if its deadline passed already
+        _get_remaining_timeout(requests[0])
         # skip executor if endpoints mismatch
         if (requests[0].header.exec_endpoint not in self._executor.requests
                 and __default_endpoint__ not in self._executor.requests
@@ -30,8 +30,17 @@ class GatewayStreamer:
         graph_conditions: Dict = {},
         deployments_metadata: Dict[str, Dict[str, str]] = {},
         deployments_no_reduce: List[str] = [],
+        deployments_load_balancing: Dict[str, str] = {},
         timeout_send: Optional[float] = None,
         retries: int = 0,
+        hedging_percentile: Optional[float] = None,
+        hedging_budget: float = 0.1,
+        circuit_breaker_failures: Optional[int] = None,
+        circuit_breaker_error_rate: Optional[float] = None,
+        circuit_breaker_probe_interval: float = 1.0,
+        retry_budget: Optional[float] = None,
+        multiplex_requests: bool = False,
+        prewarm_connections: bool = False,
         compression: Optional[str] = None,
         runtime_name: str = 'custom gateway',
         prefetch: int = 0,
@@ -50,8 +59,23 @@ class GatewayStreamer:
         :param deployments_metadata: Dictionary with the metadata of each Deployment. Each executor deployment can have a list of key-value pairs to
             provide information associated with the request to the deployment.
         :param deployments_no_reduce: list of Executor disabling the built-in merging mechanism.
+        :param deployments_load_balancing: Dictionary with the load balancing strategy (`ROUND_ROBIN`, `LEAST_OUTSTANDING` or `LATENCY_AWARE`)
+            used to select the replicas of each Deployment. Deployments not listed use round robin.
         :param timeout_send: Timeout to be considered when sending requests to Executors
         :param retries: Number of retries to try to make successfull sendings to Executors
+        :param hedging_percentile: If set, a request that did not get a response after this percentile of the recent
+            response latencies of an Executor is sent to a second replica
+        :param hedging_budget: The maximum fraction of the requests that can be sent to a second replica
+        :param circuit_breaker_failures: If set, a replica is ejected from the load balancing after this many
+            consecutive failed calls
+        :param circuit_breaker_error_rate: If set, a replica is ejected from the load balancing when the fraction of
+            failed calls among its recent calls reaches this value
+        :param circuit_breaker_probe_interval: The interval in seconds between two health checks of an ejected replica
+        :param retry_budget: If set, the maximum fraction of the requests to Executors that can be retried
+        :param multiplex_requests: If True, the requests to each Executor go through one long-lived stream per
+            connection instead of one call per request
+        :param prewarm_connections: If True, the connections to the Executors are established in the background and a
+            replica only receives requests once its connection is ready
         :param compression: The compression mechanism used when sending requests from the Head to the WorkerRuntimes. For more details, check https://grpc.github.io/grpc/python/grpc.html#compression.
         :param runtime_name: Name to be used for monitoring.
         :param prefetch: How many Requests are processed from the Client at the same time.
@@ -75,6 +99,15 @@ class GatewayStreamer:
 
         self._connection_pool = self._create_connection_pool(
             executor_addresses,
+            deployments_load_balancing,
+            hedging_percentile,
+            hedging_budget,
+            circuit_breaker_failures,
+            circuit_breaker_error_rate,
+            circuit_breaker_probe_interval,
+            retry_budget,
+            multiplex_requests,
+            prewarm_connections,
             compression,
             metrics_registry,
             meter,
@@ -116,6 +149,15 @@ class GatewayStreamer:
     def _create_connection_pool(
         self,
         deployments_addresses,
+        deployments_load_balancing,
+        hedging_percentile,
+        hedging_budget,
+        circuit_breaker_failures,
+        circuit_breaker_error_rate,
+        circuit_breaker_probe_interval,
+        retry_budget,
+        multiplex_requests,
+        prewarm_connections,
         compression,
         metrics_registry,
         meter,
@@ -132,6 +174,15 @@ class GatewayStreamer:
             meter=meter,
             aio_tracing_client_interceptors=aio_tracing_client_interceptors,
             tracing_client_interceptor=tracing_client_interceptor,
+            load_balancing=deployments_load_balancing,
+            hedging_percentile=hedging_percentile,
+            hedging_budget=hedging_budget,
+            circuit_breaker_failures=circuit_breaker_failures,
+            circuit_breaker_error_rate=circuit_breaker_error_rate,
+            circuit_breaker_probe_interval=circuit_breaker_probe_interval,
+            retry_budget=retry_budget,
+            multiplex_requests=multiplex_requests,
+            prewarm_connections=prewarm_connections,
         )
         for deployment_name, addresses in deployments_addresses.items():
             for address in addresses:
@@ -1,5 +1,6 @@
 import copy
-from typing import Dict, Optional, TypeVar, Union
+import math
+from typing import Any, Dict, Optional, TypeVar, Union
 
 from docarray import DocumentArray
 from google.protobuf import json_format
@@ -14,6 +15,41 @@ RequestSourceType = TypeVar(
 )
 
 
+def _to_struct_value(value: Any) -> Any:
+    """Copy a parameters value and convert it the same way as writing it to a `Struct` and reading it back does
+
+    :param value: the value to convert
+    :return: the converted copy of the value
+    """
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    elif isinstance(value, (int, float)):
+        value = float(value)
+        if math.isnan(value):
+            return 'NaN'
+        elif math.isinf(value):
+            return 'Infinity' if value > 0 else '-Infinity'
+        return value
+    elif isinstance(value, dict):
+        converted = {}
+        for key, v in value.items():
+            if not isinstance(key, str):
+                raise TypeError(f'parameter keys must be str, got {typename(key)}')
+            converted[key] = _to_struct_value(v)
+        return converted
+    elif isinstance(value, list):
+        return [_to_struct_value(v) for v in value]
+    raise ValueError(f'Unexpected type {typename(value)} in parameters')
+
+
+def _copy_struct_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _copy_struct_value(v) for key, v in value.items()}
+    elif isinstance(value, list):
+        return [_copy_struct_value(v) for v in value]
+    return value
+
+
 class DataRequest(Request):
     """
     Represents a DataRequest used for exchanging :class:`docarray.DocumentArray` with and within a Flow.
@@ -105,6 +141,8 @@ class DataRequest(Request):
     ):
         self.buffer = None
         self._pb_body = None
+        self._parameters = None
+        self._parameters_dirty = False
 
         try:
             if isinstance(request, jina_pb2.DataRequestProto):
@@ -157,6 +195,17 @@ class DataRequest(Request):
         """
         return type(self._pb_body) is jina_pb2.DataRequestProtoWoData
 
+    @property
+    def nbytes(self) -> int:
+        """Return total bytes consumed by protobuf. A request that was not deserialized yet is not deserialized
+        to compute it.
+
+        :return: number of bytes
+        """
+        if self.buffer:
+            return len(self.buffer)
+        return super().nbytes
+
     @property
     def proto_wo_data(
             self,
@@ -169,6 +218,7 @@ class DataRequest(Request):
         """
         if self._pb_body is None:
             self._decompress_wo_data()
+        self._sync_parameters()
         return self._pb_body
 
     @property
@@ -183,6 +233,7 @@ class DataRequest(Request):
         """
         if not self.is_decompressed:
             self._decompress()
+        self._sync_parameters()
         return self._pb_body
 
     @property
@@ -196,6 +247,7 @@ class DataRequest(Request):
         """
         if not self.is_decompressed_with_data:
             self._decompress()
+        self._sync_parameters()
         return self._pb_body
 
     def _decompress_wo_data(self):
@@ -260,19 +312,78 @@ class DataRequest(Request):
     def parameters(self) -> Dict:
         """Return the `parameters` field of this DataRequest as a Python dict
 
+        The parameters are converted from the proto only once and cached, every call returns a new copy of the
+        cached dict, so modifying it does not modify the request.
+
         :return: a Python dict view of the parameters.
         """
-        # if u get this u need to have it decompressed
-        return json_format.MessageToDict(self.proto_wo_data.parameters)
+        if self._parameters is None:
+            # if u get this u need to have it decompressed
+            self._parameters = json_format.MessageToDict(self.proto_wo_data.parameters)
+        return _copy_struct_value(self._parameters)
 
     @parameters.setter
     def parameters(self, value: Dict):
         """Set the `parameters` field of this Request to a Python dict
 
+        The parameters are only written to the proto when the proto is accessed, e.g. to serialize the request.
+
         :param value: a Python dict
         """
-        self.proto_wo_data.parameters.Clear()
-        self.proto_wo_data.parameters.update(value)
+        parameters = _to_struct_value(value)
+        # the request is not sent as the buffer it was received as anymore
+        self.proto_wo_data
+        self._parameters = parameters
+        self._parameters_dirty = True
+
+    def _sync_parameters(self):
+        """Write the parameters set since the proto was last accessed to the proto"""
+        if self._parameters_dirty:
+            self._parameters_dirty = False
+            self._pb_body.parameters.Clear()
+            self._pb_body.parameters.update(self._parameters)
+
+    def _invalidate_parameters(self):
+        self._parameters = None
+        self._parameters_dirty = False
+
+    def __getstate__(self):
+        self._sync_parameters()
+        return super().__getstate__()
+
+    def MergeFrom(self, other: 'DataRequest') -> None:
+        """Merge the content of target
+
+        :param other: the request to merge from
+        """
+        self._sync_parameters()
+        other._sync_parameters()
+        super().MergeFrom(other)
+        self._invalidate_parameters()
+
+    def CopyFrom(self, other: 'DataRequest') -> None:
+        """Copy the content of target
+
+        :param other: the request to copy from
+        """
+        other._sync_parameters()
+        super().CopyFrom(other)
+        self._invalidate_parameters()
+
+    def clear(self) -> None:
+        """Remove all values from all fields of this request."""
+        super().clear()
+        self._invalidate_parameters()
+
+    def pop(self, *fields) -> None:
+        """Remove the values from the given fields of this request.
+
+        :param fields: field names
+        """
+        self._sync_parameters()
+        super().pop(*fields)
+        if 'parameters' in fields:
+            self._invalidate_parameters()
 
     @property
     def response(self):
@@ -63,6 +63,14 @@ ac_table = {
             '--monitoring',
             '--port-monitoring',
             '--retries',
+            '--retry-budget',
+            '--hedging-percentile',
+            '--hedging-budget',
+            '--circuit-breaker-failures',
+            '--circuit-breaker-error-rate',
+            '--circuit-breaker-probe-interval',
+            '--multiplex-requests',
+            '--prewarm-connections',
             '--floating',
             '--tracing',
             '--traces-exporter-host',
@@ -78,6 +86,7 @@ ac_table = {
             '--uses-after-address',
             '--connection-list',
             '--timeout-send',
+            '--load-balancing',
         ],
         'flow': [
             '--help',
@@ -145,6 +154,7 @@ ac_table = {
             '--deployments-metadata',
             '--deployments-no-reduce',
             '--deployments-disable-reduce',
+            '--deployments-load-balancing',
             '--compression',
             '--timeout-send',
             '--runtime-cls',
@@ -158,6 +168,14 @@ ac_table = {
             '--monitoring',
             '--port-monitoring',
             '--retries',
+            '--retry-budget',
+            '--hedging-percentile',
+            '--hedging-budget',
+            '--circuit-breaker-failures',
+            '--circuit-breaker-error-rate',
+            '--circuit-breaker-probe-interval',
+            '--multiplex-requests',
+            '--prewarm-connections',
             '--floating',
             '--tracing',
             '--traces-exporter-host',
@@ -275,6 +293,14 @@ ac_table = {
             '--monitoring',
             '--port-monitoring',
             '--retries',
+            '--retry-budget',
+            '--hedging-percentile',
+            '--hedging-budget',
+            '--circuit-breaker-failures',
+            '--circuit-breaker-error-rate',
+            '--circuit-breaker-probe-interval',
+            '--multiplex-requests',
+            '--prewarm-connections',
             '--floating',
             '--tracing',
             '--traces-exporter-host',
@@ -290,6 +316,7 @@ ac_table = {
             '--uses-after-address',
             '--connection-list',
             '--timeout-send',
+            '--load-balancing',
         ],
         'deployment': [
             '--help',
@@ -336,6 +363,14 @@ ac_table = {
             '--monitoring',
             '--port-monitoring',
             '--retries',
+            '--retry-budget',
+            '--hedging-percentile',
+            '--hedging-budget',
+            '--circuit-breaker-failures',
+            '--circuit-breaker-error-rate',
+            '--circuit-breaker-probe-interval',
+            '--multiplex-requests',
+            '--prewarm-connections',
             '--floating',
             '--tracing',
             '--traces-exporter-host',
@@ -351,6 +386,7 @@ ac_table = {
             '--uses-after-address',
             '--connection-list',
             '--timeout-send',
+            '--load-balancing',
             '--uses-before',
             '--uses-after',
             '--when',
@@ -0,0 +1,84 @@
+"""Micro benchmark of reading and writing `DataRequest.parameters` along the hops of a Flow.
+
+Every hop deserializes the request, reads the parameters a few times (gateway, head and worker all look at them),
+sets them once and serializes the request again. The legacy path converts the `Struct` on every read and rebuilds it
+on every write, the current path uses the cached parameters of `DataRequest`.
+
+usage: python scripts/benchmark-request-parameters.py [--hops 3] [--reads 4] [--repetitions 2000]
+"""
+import argparse
+import time
+
+from google.protobuf import json_format
+
+from jina.proto.serializer import DataRequestProto
+from jina.types.request.data import DataRequest
+
+PARAMETERS = {
+    'top_k': 10,
+    'limit': 100,
+    'filter': {'tags__color': {'$eq': 'red'}, 'tags__price': {'$lt': 50}},
+    'fields': ['id', 'text', 'embedding', 'tags'],
+    'traversal_paths': '@r',
+    'executor_a': {'batch_size': 32, 'normalize': True},
+}
+
+
+def _legacy_read(request: DataRequest):
+    return json_format.MessageToDict(request.proto_wo_data.parameters)
+
+
+def _legacy_write(request: DataRequest, value: dict):
+    request.proto_wo_data.parameters.Clear()
+    request.proto_wo_data.parameters.update(value)
+
+
+def _cached_read(request: DataRequest):
+    return request.parameters
+
+
+def _cached_write(request: DataRequest, value: dict):
+    request.parameters = value
+
+
+def _run(payload: bytes, read, write, hops: int, reads: int) -> bytes:
+    for _ in range(hops):
+        request = DataRequestProto.FromString(payload)
+        for _ in range(reads):
+            parameters = read(request)
+        parameters['hop'] = parameters.get('hop', 0) + 1
+        write(request, parameters)
+        payload = DataRequestProto.SerializeToString(request)
+    return payload
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--hops', type=int, default=3)
+    parser.add_argument('--reads', type=int, default=4)
+    parser.add_argument('--repetitions', type=int, default=2000)
+    args = parser.parse_args()
+
+    request = DataRequest()
+    request.parameters = PARAMETERS
+    payload = DataRequestProto.SerializeToString(request)
+
+    for name, read, write in [
+        ('legacy', _legacy_read, _legacy_write),
+        ('cached', _cached_read, _cached_write),
+    ]:
+        result = _run(payload, read, write, args.hops, args.reads)
+        assert DataRequest(result).parameters['hop'] == args.hops
+
+        start = time.perf_counter()
+        for _ in range(args.repetitions):
+            _run(payload, read, write, args.hops, args.reads)
+        elapsed = time.perf_counter() - start
+        print(
+            f'{name}: {elapsed / (args.repetitions * args.hops) * 1e6:.1f} us per hop '
+            f'({args.reads} reads, 1 write)'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -216,3 +216,13 @@ def test_request_generate_numpy_arrays_iterator():
     assert len(request.docs) == 5
     for index, doc in enumerate(request.docs, 1):
         assert doc.tensor.shape == (10,)
+
+
+def test_request_generate_deadline():
+    import time
+
+    req = next(request_generator('', data=[Document()], timeout=10))
+    assert time.time() + 9 < req.header.timeout <= time.time() + 11
+
+    req = next(request_generator('', data=[Document()]))
+    assert not req.header.HasField('timeout')
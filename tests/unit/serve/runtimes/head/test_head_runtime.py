@@ -232,6 +232,7 @@ async def test_head_runtime_reflection():
         for service_name in [
             'jina.JinaDataRequestRPC',
             'jina.JinaSingleDataRequestRPC',
+            'jina.JinaDataRequestStreamRPC',
         ]
     )
 
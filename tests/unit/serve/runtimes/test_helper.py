@@ -1,7 +1,9 @@
+import grpc
 import pytest
 
 from jina.serve.runtimes.helper import (
     _get_name_from_replicas_name,
+    _get_remaining_timeout,
     _is_param_for_specific_executor,
     _parse_specific_params,
     _spit_key_and_executor_name,
@@ -61,3 +63,23 @@ def test_parse_specific_param(param, parsed_param, executor_name):
 )
 def test_get_name_from_replicas(name_w_replicas, name):
     assert _get_name_from_replicas_name(name_w_replicas) == name
+
+
+def test_get_remaining_timeout():
+    import time
+
+    from jina.excepts import RequestDeadlineExceeded
+    from jina.types.request.data import DataRequest
+
+    req = DataRequest()
+    assert _get_remaining_timeout(req) is None
+    assert _get_remaining_timeout(req, 2.0) == 2.0
+
+    req.header.timeout = int(time.time()) + 100
+    assert 98 < _get_remaining_timeout(req) <= 100
+    assert _get_remaining_timeout(req, 2.0) == 2.0
+
+    req.header.timeout = int(time.time()) - 1
+    with pytest.raises(RequestDeadlineExceeded) as exc_info:
+        _get_remaining_timeout(req, 2.0)
+    assert exc_info.value.code() == grpc.StatusCode.DEADLINE_EXCEEDED
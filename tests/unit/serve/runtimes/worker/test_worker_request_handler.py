@@ -132,3 +132,23 @@ async def test_worker_request_handler_clear_docs(logger):
     response = await handler.handle(requests=[req])
 
     assert len(response.docs) == 0
+
+
+@pytest.mark.asyncio
+async def test_worker_request_handler_drops_expired_request(logger):
+    from jina.excepts import RequestDeadlineExceeded
+    from jina.types.request.data import DataRequest
+
+    args = set_pod_parser().parse_args(['--uses', 'NewDocsExecutor'])
+    handler = WorkerRequestHandler(args, logger)
+    req = list(
+        request_generator(
+            '/', DocumentArray([Document(text='input document') for _ in range(10)])
+        )
+    )[0]
+    req.header.timeout = 1
+    req = DataRequest(req.SerializeToString())
+
+    with pytest.raises(RequestDeadlineExceeded):
+        await handler.handle(requests=[req])
+    assert not req.is_decompressed_with_data
@@ -285,6 +285,7 @@ async def test_worker_runtime_reflection():
         for service_name in [
             'jina.JinaDataRequestRPC',
             'jina.JinaSingleDataRequestRPC',
+            'jina.JinaDataRequestStreamRPC',
         ]
     )
 
@@ -0,0 +1,606 @@
+import asyncio
+
+import grpc
+import pytest
+
+from jina.enums import LoadBalancingType
+from jina.helper import random_port
+from jina.logging.logger import JinaLogger
+from jina.proto import jina_pb2, jina_pb2_grpc
+from jina.proto.serializer import process_bytes_counter
+from jina.serve.networking import (
+    ERROR_RATE_WINDOW_SIZE,
+    GrpcConnectionPool,
+    ReplicaList,
+    _NetworkingHistograms,
+    _NetworkingMetrics,
+)
+from jina.serve.runtimes.helper import _process_data_stream
+from jina.types.request.data import DataRequest
+
+
+def _create_replica_list(load_balancing=LoadBalancingType.ROUND_ROBIN, metrics=None):
+    return ReplicaList(
+        metrics=metrics or _NetworkingMetrics(None, None, None),
+        histograms=_NetworkingHistograms(),
+        logger=JinaLogger('test'),
+        runtime_name='test',
+        load_balancing=load_balancing,
+    )
+
+
+@pytest.mark.asyncio
+async def test_round_robin():
+    replica_list = _create_replica_list()
+    for port in range(3):
+        replica_list.add_connection(f'0.0.0.0:{port}', deployment_name='executor')
+
+    addresses = [
+        (await replica_list.get_next_connection()).address for _ in range(6)
+    ]
+    assert addresses == [f'0.0.0.0:{port}' for port in range(3)] * 2
+    await replica_list.close()
+
+
+@pytest.mark.asyncio
+async def test_least_outstanding_requests():
+    replica_list = _create_replica_list(LoadBalancingType.LEAST_OUTSTANDING)
+    for port in range(3):
+        replica_list.add_connection(f'0.0.0.0:{port}', deployment_name='executor')
+
+    connections = replica_list.get_all_connections()
+    connections[0].num_pending_requests = 5
+    connections[1].num_pending_requests = 1
+    connections[2].num_pending_requests = 3
+    for _ in range(3):
+        assert (await replica_list.get_next_connection()).address == '0.0.0.0:1'
+
+    # ties are broken in round robin order
+    connections[1].num_pending_requests = 3
+    selected = {
+        (await replica_list.get_next_connection()).address for _ in range(2)
+    }
+    assert selected == {'0.0.0.0:1', '0.0.0.0:2'}
+    await replica_list.close()
+
+
+@pytest.mark.asyncio
+async def test_pending_requests_are_tracked():
+    from prometheus_client import CollectorRegistry
+
+    registry = CollectorRegistry()
+    pool = GrpcConnectionPool(
+        runtime_name='test',
+        metrics_registry=registry,
+        load_balancing={'executor': 'LEAST_OUTSTANDING'},
+    )
+    pool.add_connection(deployment='executor', address='0.0.0.0:1')
+    replica_list = pool._connections.get_replicas('executor', False, 0)
+    assert replica_list.load_balancing == LoadBalancingType.LEAST_OUTSTANDING
+
+    connection = replica_list.get_all_connections()[0]
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def _fake_send_requests(*args, **kwargs):
+        started.set()
+        await release.wait()
+        return 'response', None
+
+    connection._send_requests = _fake_send_requests
+    task = asyncio.create_task(
+        connection.send_requests(requests=[], metadata=None, compression=None)
+    )
+    await started.wait()
+
+    labels = {'runtime_name': 'test', 'deployment': 'executor', 'address': '0.0.0.0:1'}
+    assert connection.num_pending_requests == 1
+    assert (
+        registry.get_sample_value('jina_number_of_pending_requests_per_replica', labels)
+        == 1
+    )
+
+    release.set()
+    assert await task == ('response', None)
+    assert connection.num_pending_requests == 0
+    assert (
+        registry.get_sample_value('jina_number_of_pending_requests_per_replica', labels)
+        == 0
+    )
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_latency_aware_prefers_faster_replica():
+    replica_list = _create_replica_list(LoadBalancingType.LATENCY_AWARE)
+    for port in range(2):
+        replica_list.add_connection(f'0.0.0.0:{port}', deployment_name='executor')
+
+    slow, fast = replica_list.get_all_connections()
+    slow._update_latency_ewma(1.0)
+    fast._update_latency_ewma(0.1)
+    for _ in range(4):
+        assert (await replica_list.get_next_connection()).address == '0.0.0.0:1'
+
+    # pending requests make the faster replica more expensive
+    fast.num_pending_requests = 10
+    assert (await replica_list.get_next_connection()).address == '0.0.0.0:0'
+    await replica_list.close()
+
+
+@pytest.mark.asyncio
+async def test_latency_aware_tries_unmeasured_replicas_first():
+    replica_list = _create_replica_list(LoadBalancingType.LATENCY_AWARE)
+    for port in range(4):
+        replica_list.add_connection(f'0.0.0.0:{port}', deployment_name='executor')
+    for connection in replica_list.get_all_connections()[1:]:
+        connection._update_latency_ewma(0.5)
+
+    selected = [
+        (await replica_list.get_next_connection()).address for _ in range(50)
+    ]
+    assert '0.0.0.0:0' in selected
+    await replica_list.close()
+
+
+def test_latency_ewma():
+    connection, _ = GrpcConnectionPool.create_async_channel_stub(
+        '0.0.0.0:1',
+        deployment_name='executor',
+        metrics=_NetworkingMetrics(None, None, None),
+        histograms=_NetworkingHistograms(),
+    )
+    assert connection.latency_score == 0.0
+    connection._update_latency_ewma(1.0)
+    assert connection.latency_ewma == 1.0
+    connection._update_latency_ewma(2.0)
+    assert 1.0 < connection.latency_ewma < 2.0
+
+
+def _fake_send_requests(response, delay):
+    async def _send_requests(*args, **kwargs):
+        await asyncio.sleep(delay)
+        return response, None
+
+    return _send_requests
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('hedging_budget', [0.0, 1.0])
+async def test_hedged_requests(hedging_budget):
+    from prometheus_client import CollectorRegistry
+
+    registry = CollectorRegistry()
+    pool = GrpcConnectionPool(
+        runtime_name='test',
+        metrics_registry=registry,
+        hedging_percentile=90,
+        hedging_budget=hedging_budget,
+    )
+    pool.add_connection(deployment='executor', address='0.0.0.0:1')
+    pool.add_connection(deployment='executor', address='0.0.0.0:2')
+    replica_list = pool._connections.get_replicas('executor', False, 0)
+    for _ in range(10):
+        replica_list.record_latency(0.01)
+    slow, fast = replica_list.get_all_connections()
+    slow._send_requests = _fake_send_requests('slow', 0.5)
+    fast._send_requests = _fake_send_requests('fast', 0.0)
+
+    response, _ = await pool.send_requests_once(
+        requests=[DataRequest()], deployment='executor'
+    )
+
+    labels = {'runtime_name': 'test'}
+    if hedging_budget:
+        assert response == 'fast'
+        assert registry.get_sample_value('jina_hedged_requests_total', labels) == 1
+        assert (
+            registry.get_sample_value('jina_won_hedged_requests_total', labels) == 1
+        )
+        assert slow.num_pending_requests == 0
+    else:
+        assert response == 'slow'
+        assert registry.get_sample_value('jina_hedged_requests_total', labels) == 0
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_not_sent_if_fast():
+    pool = GrpcConnectionPool(
+        runtime_name='test', hedging_percentile=90, hedging_budget=1.0
+    )
+    pool.add_connection(deployment='executor', address='0.0.0.0:1')
+    pool.add_connection(deployment='executor', address='0.0.0.0:2')
+    replica_list = pool._connections.get_replicas('executor', False, 0)
+    for _ in range(10):
+        replica_list.record_latency(0.5)
+    first, second = replica_list.get_all_connections()
+    first._send_requests = _fake_send_requests('first', 0.0)
+    second._send_requests = _fake_send_requests('second', 0.0)
+
+    response, _ = await pool.send_requests_once(
+        requests=[DataRequest()], deployment='executor'
+    )
+    assert response == 'first'
+    await pool.close()
+
+
+def test_request_budget():
+    from jina.serve.networking import _RequestBudget
+
+    budget = _RequestBudget(0.5)
+    assert not budget.withdraw()
+    budget.deposit()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+
+def _failing_send_requests(code):
+    async def _send_requests(*args, **kwargs):
+        raise grpc.aio.AioRpcError(code, None, None, details='failed')
+
+    return _send_requests
+
+
+async def _send_to_replica(connection):
+    try:
+        await connection.send_requests(requests=[], metadata=None, compression=None)
+    except grpc.aio.AioRpcError:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_consecutive_failures(monkeypatch):
+    from grpc_health.v1 import health_pb2
+    from prometheus_client import CollectorRegistry
+
+    registry = CollectorRegistry()
+    pool = GrpcConnectionPool(
+        runtime_name='test',
+        metrics_registry=registry,
+        circuit_breaker_failures=3,
+        circuit_breaker_probe_interval=0.01,
+    )
+    pool.add_connection(deployment='executor', address='0.0.0.0:1')
+    pool.add_connection(deployment='executor', address='0.0.0.0:2')
+    replica_list = pool._connections.get_replicas('executor', False, 0)
+    failing, healthy = replica_list.get_all_connections()
+    failing._send_requests = _failing_send_requests(grpc.StatusCode.UNAVAILABLE)
+    # errors raised by the Executor itself do not count as failures of the replica
+    healthy._send_requests = _failing_send_requests(grpc.StatusCode.UNKNOWN)
+
+    for _ in range(3):
+        await _send_to_replica(failing)
+        await _send_to_replica(healthy)
+    assert failing.consecutive_failures == 3
+    assert healthy.consecutive_failures == 0
+
+    serving = asyncio.Event()
+
+    async def _health_check(*args, **kwargs):
+        await serving.wait()
+        return health_pb2.HealthCheckResponse(
+            status=health_pb2.HealthCheckResponse.SERVING
+        )
+
+    monkeypatch.setattr(GrpcConnectionPool, 'send_health_check_async', _health_check)
+
+    for _ in range(4):
+        assert (await replica_list.get_next_connection()).address == '0.0.0.0:2'
+    labels = {'runtime_name': 'test', 'deployment': 'executor', 'address': '0.0.0.0:1'}
+    assert failing.ejected
+    assert registry.get_sample_value('jina_ejected_replicas', labels) == 1
+
+    serving.set()
+    while failing.ejected:
+        await asyncio.sleep(0.01)
+    assert failing.consecutive_failures == 0
+    assert registry.get_sample_value('jina_ejected_replicas', labels) == 0
+    addresses = {
+        (await replica_list.get_next_connection()).address for _ in range(2)
+    }
+    assert addresses == {'0.0.0.0:1', '0.0.0.0:2'}
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_error_rate():
+    replica_list = ReplicaList(
+        metrics=_NetworkingMetrics(None, None, None),
+        histograms=_NetworkingHistograms(),
+        logger=JinaLogger('test'),
+        runtime_name='test',
+        circuit_breaker_error_rate=0.5,
+        circuit_breaker_probe_interval=10,
+    )
+    for port in range(2):
+        replica_list.add_connection(f'0.0.0.0:{port}', deployment_name='executor')
+    flaky, _ = replica_list.get_all_connections()
+    for i in range(ERROR_RATE_WINDOW_SIZE):
+        flaky._record_outcome(i % 2 == 0)
+    assert flaky.error_rate == 0.5
+    assert flaky.consecutive_failures == 1
+
+    for _ in range(2):
+        assert (await replica_list.get_next_connection()).address == '0.0.0.0:1'
+    assert flaky.ejected
+    await replica_list.close()
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_keeps_replicas_if_all_ejected():
+    replica_list = ReplicaList(
+        metrics=_NetworkingMetrics(None, None, None),
+        histograms=_NetworkingHistograms(),
+        logger=JinaLogger('test'),
+        runtime_name='test',
+        circuit_breaker_failures=1,
+        circuit_breaker_probe_interval=10,
+    )
+    for port in range(2):
+        replica_list.add_connection(f'0.0.0.0:{port}', deployment_name='executor')
+    for connection in replica_list.get_all_connections():
+        connection._record_outcome(False)
+
+    addresses = [
+        (await replica_list.get_next_connection()).address for _ in range(2)
+    ]
+    assert addresses == ['0.0.0.0:0', '0.0.0.0:1']
+    assert all(c.ejected for c in replica_list.get_all_connections())
+    await replica_list.close()
+
+
+@pytest.mark.asyncio
+async def test_retry_budget():
+    from prometheus_client import CollectorRegistry
+
+    from jina.excepts import InternalNetworkError
+
+    registry = CollectorRegistry()
+    pool = GrpcConnectionPool(
+        runtime_name='test', metrics_registry=registry, retry_budget=0.0
+    )
+    pool.add_connection(deployment='executor', address='0.0.0.0:1')
+    pool.add_connection(deployment='executor', address='0.0.0.0:2')
+    replica_list = pool._connections.get_replicas('executor', False, 0)
+    num_calls = 0
+
+    async def _send_requests(*args, **kwargs):
+        nonlocal num_calls
+        num_calls += 1
+        raise grpc.aio.AioRpcError(grpc.StatusCode.UNAVAILABLE, None, None)
+
+    for connection in replica_list.get_all_connections():
+        connection._send_requests = _send_requests
+
+    # the budget starts full, a budget of 0.0 does not earn any more retries
+    result = await pool.send_requests_once(
+        requests=[DataRequest()], deployment='executor', retries=20
+    )
+    assert isinstance(result, InternalNetworkError)
+    assert num_calls == 11
+    labels = {'runtime_name': 'test'}
+    assert registry.get_sample_value('jina_retry_budget_exhausted_total', labels) == 1
+
+    num_calls = 0
+    result = await pool.send_requests_once(
+        requests=[DataRequest()], deployment='executor', retries=20
+    )
+    assert isinstance(result, InternalNetworkError)
+    assert num_calls == 1
+    assert registry.get_sample_value('jina_retry_budget_exhausted_total', labels) == 2
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_expired_request_is_not_sent():
+    import time
+
+    from jina.excepts import RequestDeadlineExceeded
+
+    pool = GrpcConnectionPool(runtime_name='test')
+    pool.add_connection(deployment='executor', address='0.0.0.0:1')
+    replica_list = pool._connections.get_replicas('executor', False, 0)
+    timeouts = []
+
+    async def _send_requests(requests, metadata, compression, timeout):
+        timeouts.append(timeout)
+        return 'response', None
+
+    replica_list.get_all_connections()[0]._send_requests = _send_requests
+
+    request = DataRequest()
+    request.header.timeout = int(time.time()) + 100
+    await pool.send_requests_once(
+        requests=[request], deployment='executor', timeout=200
+    )
+    assert 98 < timeouts[0] <= 100
+
+    request.header.timeout = int(time.time()) - 1
+    result = await pool.send_requests_once(
+        requests=[request], deployment='executor', timeout=200
+    )
+    assert isinstance(result, RequestDeadlineExceeded)
+    assert len(timeouts) == 1
+    await pool.close()
+
+
+class _DataStreamServicer:
+    def __init__(self):
+        self.num_streams = 0
+
+    async def process_single_data(self, request, context):
+        delay = request.parameters['delay']
+        if delay < 0:
+            context.set_code(grpc.StatusCode.UNAVAILABLE)
+            context.set_details('intentional failure')
+            return DataRequest()
+        await asyncio.sleep(delay)
+        return request
+
+    async def process_data_stream(self, request_iterator, context):
+        self.num_streams += 1
+        async for response in _process_data_stream(
+            self.process_single_data, request_iterator, context
+        ):
+            yield response
+
+
+def _create_delayed_request(delay):
+    request = DataRequest()
+    request.parameters = {'delay': delay}
+    return request
+
+
+@pytest.mark.asyncio
+async def test_multiplexed_requests():
+    from grpc_reflection.v1alpha import reflection
+
+    servicer = _DataStreamServicer()
+    server = grpc.aio.server()
+    jina_pb2_grpc.add_JinaDataRequestStreamRPCServicer_to_server(servicer, server)
+    reflection.enable_server_reflection(
+        (
+            jina_pb2.DESCRIPTOR.services_by_name['JinaDataRequestStreamRPC'].full_name,
+            reflection.SERVICE_NAME,
+        ),
+        server,
+    )
+    port = random_port()
+    server.add_insecure_port(f'127.0.0.1:{port}')
+    await server.start()
+
+    connection, channel = GrpcConnectionPool.create_async_channel_stub(
+        f'127.0.0.1:{port}',
+        deployment_name='executor',
+        metrics=_NetworkingMetrics(None, None, None),
+        histograms=_NetworkingHistograms(),
+        multiplex_requests=True,
+    )
+    slow_request = _create_delayed_request(0.5)
+    fast_request = _create_delayed_request(0.0)
+    slow_task = asyncio.create_task(
+        connection.send_requests([slow_request], None, None)
+    )
+    fast_response, metadata = await connection.send_requests(
+        [fast_request], (('endpoint', '/'),), None
+    )
+    # the fast request does not wait for the slow one sent before it on the same stream
+    assert not slow_task.done()
+    assert fast_response.header.request_id == fast_request.header.request_id
+    assert 'is-error' not in metadata
+    slow_response, _ = await slow_task
+    assert slow_response.header.request_id == slow_request.header.request_id
+
+    failing_request = _create_delayed_request(-1)
+    with pytest.raises(grpc.aio.AioRpcError) as exc_info:
+        await connection.send_requests([failing_request], None, None)
+    assert exc_info.value.code() == grpc.StatusCode.UNAVAILABLE
+    assert exc_info.value.details() == 'intentional failure'
+
+    # a failed request does not break the stream
+    await connection.send_requests([_create_delayed_request(0.0)], None, None)
+    assert servicer.num_streams == 1
+    assert connection.num_pending_requests == 0
+
+    await channel.close()
+    await server.stop(0)
+
+
+@pytest.mark.asyncio
+async def test_prewarmed_connections():
+    from grpc_reflection.v1alpha import reflection
+
+    server = grpc.aio.server()
+    jina_pb2_grpc.add_JinaDataRequestStreamRPCServicer_to_server(
+        _DataStreamServicer(), server
+    )
+    reflection.enable_server_reflection(
+        (
+            jina_pb2.DESCRIPTOR.services_by_name['JinaDataRequestStreamRPC'].full_name,
+            reflection.SERVICE_NAME,
+        ),
+        server,
+    )
+    port = random_port()
+    server.add_insecure_port(f'127.0.0.1:{port}')
+    await server.start()
+
+    replica_list = ReplicaList(
+        metrics=_NetworkingMetrics(None, None, None),
+        histograms=_NetworkingHistograms(),
+        logger=JinaLogger('test'),
+        runtime_name='test',
+        prewarm_connections=True,
+    )
+    unavailable_address = f'127.0.0.1:{random_port()}'
+    replica_list.add_connection(unavailable_address, deployment_name='executor')
+    replica_list.add_connection(f'127.0.0.1:{port}', deployment_name='executor')
+    # no replica is in the selection before its channel is ready
+    assert replica_list.get_all_connections() == []
+    assert replica_list.has_connection(unavailable_address)
+
+    connection = await replica_list.get_next_connection()
+    assert connection.address == f'127.0.0.1:{port}'
+    # the stubs were resolved during the warm up
+    assert connection._initialized
+    assert connection.data_stream_stub is not None
+    assert replica_list.get_all_connections() == [connection]
+
+    await replica_list.remove_connection(unavailable_address)
+    assert not replica_list.has_connection(unavailable_address)
+    await replica_list.close()
+    await server.stop(0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('multiplex_requests', [False, True])
+async def test_bytes_are_counted_per_connection(multiplex_requests):
+    from grpc_reflection.v1alpha import reflection
+
+    servicer = _DataStreamServicer()
+    server = grpc.aio.server()
+    jina_pb2_grpc.add_JinaSingleDataRequestRPCServicer_to_server(servicer, server)
+    jina_pb2_grpc.add_JinaDataRequestStreamRPCServicer_to_server(servicer, server)
+    reflection.enable_server_reflection(
+        (
+            jina_pb2.DESCRIPTOR.services_by_name['JinaSingleDataRequestRPC'].full_name,
+            jina_pb2.DESCRIPTOR.services_by_name['JinaDataRequestStreamRPC'].full_name,
+            reflection.SERVICE_NAME,
+        ),
+        server,
+    )
+    port = random_port()
+    server.add_insecure_port(f'127.0.0.1:{port}')
+    await server.start()
+
+    connections = []
+    for _ in range(2):
+        connections.append(
+            GrpcConnectionPool.create_async_channel_stub(
+                f'127.0.0.1:{port}',
+                deployment_name='executor',
+                metrics=_NetworkingMetrics(None, None, None),
+                histograms=_NetworkingHistograms(),
+                multiplex_requests=multiplex_requests,
+            )
+        )
+    (connection, channel), (other_connection, other_channel) = connections
+
+    request = _create_delayed_request(0.0)
+    nbytes = len(request.proto.SerializePartialToString())
+    process_sent_bytes = process_bytes_counter.sent_bytes
+    for _ in range(3):
+        response, _ = await connection.send_requests([request], None, None)
+    assert connection.bytes_counter.sent_bytes == 3 * nbytes
+    assert connection.bytes_counter.received_bytes == 3 * response.nbytes
+    assert other_connection.bytes_counter.sent_bytes == 0
+    assert other_connection.bytes_counter.received_bytes == 0
+    # the server runs in the same process
+    assert process_bytes_counter.sent_bytes - process_sent_bytes == 6 * nbytes
+
+    await channel.close()
+    await other_channel.close()
+    await server.stop(0)
@@ -168,6 +168,70 @@ def test_change_parameters_wo_loading_data():  # test that changing parameters d
     assert new_deserialized_request.docs == da
 
 
+def test_parameters_are_cached():
+    r = DataRequest()
+    r.parameters = {'a': 0, 'nested': {'b': [1, 'c']}}
+    byte_array = DataRequestProto.SerializeToString(r)
+
+    deserialized_request = DataRequest(byte_array)
+    parameters = deserialized_request.parameters
+    assert parameters == {'a': 0, 'nested': {'b': [1, 'c']}}
+    assert deserialized_request._parameters is not None
+
+    # modifying the returned dict does not modify the request
+    parameters['a'] = 1
+    parameters['nested']['b'].append('d')
+    assert deserialized_request.parameters == {'a': 0, 'nested': {'b': [1, 'c']}}
+
+
+def test_set_parameters_written_on_serialization():
+    r = DataRequest()
+    parameters = {'a': 0, 'b': [True, None, 'c'], 'nested': {'d': 1.5}}
+    r.parameters = parameters
+    # modifying the dict after setting it does not modify the request
+    parameters['a'] = 1
+
+    assert r.parameters == {'a': 0.0, 'b': [True, None, 'c'], 'nested': {'d': 1.5}}
+    assert r._parameters_dirty
+    assert MessageToDict(r.proto.parameters) == r.parameters
+    assert not r._parameters_dirty
+
+    r.parameters = {'e': float('inf')}
+    deserialized_request = DataRequest(DataRequestProto.SerializeToString(r))
+    assert deserialized_request.parameters == {'e': 'Infinity'}
+
+
+def test_set_parameters_copy_and_pickle():
+    import pickle
+
+    r = DataRequest()
+    r.parameters = {'a': 0}
+
+    assert copy.copy(r).parameters == {'a': 0}
+    assert copy.deepcopy(r).parameters == {'a': 0}
+    assert pickle.loads(pickle.dumps(r)).parameters == {'a': 0}
+
+    other = DataRequest()
+    other.parameters = {'b': 1}
+    other.CopyFrom(r)
+    assert other.parameters == {'a': 0}
+
+    other.pop('parameters')
+    assert other.parameters == {}
+
+
+@pytest.mark.parametrize(
+    'parameters, error',
+    [({1: 'a'}, TypeError), ({'a': (1, 2)}, ValueError), ({'a': object()}, ValueError)],
+)
+def test_set_invalid_parameters(parameters, error):
+    r = DataRequest()
+    r.parameters = {'a': 0}
+    with pytest.raises(error):
+        r.parameters = parameters
+    assert r.parameters == {'a': 0}
+
+
 def test_send_data_request_wo_data():  # check that when sending a DataRequestWoData the docs are sent
     doc_count = 1000
     r = DataRequest()